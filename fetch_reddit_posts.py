@@ -6,9 +6,14 @@ This script uses PRAW in read-only mode (no authentication required).
 
 import json
 import os
+import sys
 from datetime import datetime
 
-import praw
+# orjson is optional: faster, and writes UTF-8 bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 
 def fetch_claudecode_posts(limit=25):
@@ -25,6 +30,9 @@ def fetch_claudecode_posts(limit=25):
             "Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET before fetching Reddit posts."
         )
 
+    # Imported on use so importing this module does not load PRAW
+    import praw
+
     # Create a read-only Reddit instance.
     reddit = praw.Reddit(
         client_id=client_id,
@@ -36,9 +44,15 @@ def fetch_claudecode_posts(limit=25):
 
     subreddit = reddit.subreddit("ClaudeCode")
     posts_data = []
+    # Collected and written once after the loop instead of 4 prints per post
+    output = []
+
+    # Fetch hot posts. The listing arrives in pages of up to 100 posts, so
+    # pulling it in one go keeps all network I/O ahead of the formatting;
+    # every field below is already in the listing payload (no lazy loads).
+    posts = list(subreddit.hot(limit=limit))
 
-    # Fetch hot posts
-    for post in subreddit.hot(limit=limit):
+    for post in posts:
         post_info = {
             "title": post.title,
             "author": str(post.author),
@@ -52,15 +66,23 @@ def fetch_claudecode_posts(limit=25):
         }
         posts_data.append(post_info)
 
-        print(f"📄 {post.title}")
-        print(f"   👤 u/{post.author} | 👍 {post.score} | 💬 {post.num_comments} comments")
-        print(f"   🔗 {post_info['permalink']}")
-        print()
+        output.append(
+            f"📄 {post.title}\n"
+            f"   👤 u/{post.author} | 👍 {post.score} | 💬 {post.num_comments} comments\n"
+            f"   🔗 {post_info['permalink']}\n"
+            "\n"
+        )
+
+    sys.stdout.write("".join(output))
 
     # Save to JSON file
     output_file = "claudecode_posts.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(posts_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(posts_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(posts_data, f, indent=2, ensure_ascii=False)
 
     print(f"✅ Saved {len(posts_data)} posts to {output_file}")
     return posts_data
@@ -34,8 +34,19 @@ Provider Priority:
 Bundle Provider Priority:
     1. AWS Secrets Manager (if configured)
     2. DotEnv global config (~/.config/claude-power-pack/secrets/)
+
+The selected providers are cached for the life of the process. Call
+reset_provider_cache() to re-run selection, or set
+CLAUDE_POWER_PACK_FORCE_PROVIDER_REINIT=1 to bypass the cache entirely
+(e.g. tests that switch credentials between cases).
 """
 
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING, Any
+
 from .base import (
     BundleProvider,
     ProviderCaps,
@@ -49,7 +60,9 @@ from .base import (
 from .credentials import APICredentials, DatabaseCredentials
 from .masking import OutputMasker, mask_output, scan_for_secrets
 from .permissions import AccessLevel, OperationType, PermissionConfig
-from .providers import AWSSecretsProvider, DotEnvSecretsProvider, EnvSecretsProvider
+
+if TYPE_CHECKING:
+    from .providers import AWSSecretsProvider, DotEnvSecretsProvider, EnvSecretsProvider
 
 __all__ = [
     # Base classes
@@ -80,8 +93,69 @@ __all__ = [
     "get_credentials",
     "get_provider",
     "get_bundle_provider",
+    "reset_provider_cache",
 ]
 
+_FORCE_REINIT_ENV = "CLAUDE_POWER_PACK_FORCE_PROVIDER_REINIT"
+
+# Providers are imported on first use so that importing lib.creds (e.g. for
+# masking or the env provider) does not pay for boto3.
+_LAZY_PROVIDERS = frozenset({"AWSSecretsProvider", "DotEnvSecretsProvider", "EnvSecretsProvider"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_PROVIDERS:
+        from . import providers
+
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_aws_provider() -> AWSSecretsProvider | None:
+    """Get the shared default AWS provider, or None if AWS is not set up.
+
+    Shared so the boto3 client and the availability probe are built once.
+    Machines with no sign of AWS credentials skip the (network) probe.
+    """
+    from .providers import AWSSecretsProvider
+
+    if AWSSecretsProvider is None:
+        return None
+
+    from .providers.aws import credentials_configured
+
+    if not credentials_configured():
+        return None
+    return AWSSecretsProvider()
+
+
+@functools.lru_cache(maxsize=1)
+def _select_provider() -> SecretsProvider:
+    from .providers import EnvSecretsProvider
+
+    aws = _default_aws_provider()
+    if aws is not None and aws.is_available():
+        return aws
+    return EnvSecretsProvider()
+
+
+@functools.lru_cache(maxsize=1)
+def _select_bundle_provider() -> BundleProvider:
+    from .providers import DotEnvSecretsProvider
+
+    aws = _default_aws_provider()
+    if aws is not None and aws.is_available():
+        return aws
+    return DotEnvSecretsProvider()
+
+
+def reset_provider_cache() -> None:
+    """Forget the cached provider selection so the next call re-detects."""
+    _default_aws_provider.cache_clear()
+    _select_provider.cache_clear()
+    _select_bundle_provider.cache_clear()
+
 
 def get_provider() -> SecretsProvider:
     """Get the first available secrets provider.
@@ -91,15 +165,11 @@ def get_provider() -> SecretsProvider:
     2. Environment variables (always available)
 
     Returns:
-        The first available SecretsProvider.
+        The first available SecretsProvider (cached per process).
     """
-    # If AWS provider is available and configured, prefer it
-    if AWSSecretsProvider is not None:
-        aws = AWSSecretsProvider()
-        if aws.is_available():
-            return aws
-
-    return EnvSecretsProvider()
+    if os.environ.get(_FORCE_REINIT_ENV) == "1":
+        reset_provider_cache()
+    return _select_provider()
 
 
 def get_bundle_provider() -> BundleProvider:
@@ -110,14 +180,11 @@ def get_bundle_provider() -> BundleProvider:
     2. DotEnv global config (always available)
 
     Returns:
-        The first available BundleProvider.
+        The first available BundleProvider (cached per process).
     """
-    if AWSSecretsProvider is not None:
-        aws = AWSSecretsProvider()
-        if aws.is_available():
-            return aws
-
-    return DotEnvSecretsProvider()
+    if os.environ.get(_FORCE_REINIT_ENV) == "1":
+        reset_provider_cache()
+    return _select_bundle_provider()
 
 
 def get_credentials(
@@ -3,6 +3,10 @@
 Logs actions (who, when, what) but NEVER secret values.
 Audit log location: ~/.config/claude-power-pack/audit.log
 
+Entries are queued and appended by a background thread, so callers never
+wait on file I/O. The queue is drained at interpreter exit; call flush()
+to force pending entries to disk sooner (e.g. before reading the log).
+
 Usage:
     from lib.creds.audit import log_action
 
@@ -13,23 +17,144 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import getpass
 import logging
 import os
-from datetime import datetime, timezone
+import queue
+import threading
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _current_user() -> str:
+    """Get the login name once per process (getuser() may hit the passwd db)."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "unknown"
+
+
+def _utc_timestamp() -> str:
+    """Format the current UTC time as ISO 8601 without building a datetime."""
+    now = time.time()
+    seconds = int(now)
+    micros = int((now - seconds) * 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{micros:06d}+00:00"
+
+
+@functools.lru_cache(maxsize=1)
 def _get_audit_log_path() -> Path:
-    """Get the path to the audit log file."""
+    """Get the path to the audit log file.
+
+    Resolved once per process; call ``_get_audit_log_path.cache_clear()``
+    after changing XDG_CONFIG_HOME.
+    """
     config_home = os.environ.get(
         "XDG_CONFIG_HOME", os.path.expanduser("~/.config")
     )
     return Path(config_home) / "claude-power-pack" / "audit.log"
 
 
+class _AuditWriter:
+    """Appends queued audit entries from a daemon thread.
+
+    Keeps one O_APPEND descriptor open per log path and writes everything
+    that queued up since the last wake-up with a single os.write().
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[Path, str]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._fds: dict[Path, int] = {}
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, entry: str) -> None:
+        """Queue an entry for writing, starting the writer thread if needed."""
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._run, name="creds-audit", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((path, entry))
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        else:
+            # No writer thread (e.g. after fork): drain in the caller
+            batch = self._drain()
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def reset(self) -> None:
+        """Forget the writer thread and descriptors (used in forked children)."""
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._fds = {}
+        self._thread = None
+
+    def _drain(self, first: tuple[Path, str] | None = None) -> list[tuple[Path, str]]:
+        batch = [first] if first is not None else []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(self._queue.get())
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: list[tuple[Path, str]]) -> None:
+        by_path: dict[Path, list[str]] = {}
+        for path, entry in batch:
+            by_path.setdefault(path, []).append(entry)
+
+        with self._lock:
+            for path, entries in by_path.items():
+                try:
+                    os.write(self._open(path), "".join(entries).encode())
+                except Exception as e:
+                    # Audit logging should never block operations
+                    logger.debug(f"Audit log write failed: {e}")
+
+    def _open(self, path: Path) -> int:
+        fd = self._fds.get(path)
+        if fd is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existed = path.exists()
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            if not existed:
+                # Enforce permissions once, at creation
+                os.fchmod(fd, 0o600)
+            self._fds[path] = fd
+        return fd
+
+
+_writer = _AuditWriter()
+atexit.register(_writer.flush)
+os.register_at_fork(after_in_child=_writer.reset)
+
+
+def flush() -> None:
+    """Write any queued audit entries to disk before returning."""
+    _writer.flush()
+
+
 def log_action(
     action: str,
     project_id: str = "",
@@ -44,22 +169,10 @@ def log_action(
         project_id: The project identifier.
         details: Additional details (key names, provider, NOT values).
     """
-    log_path = _get_audit_log_path()
-
     try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now(timezone.utc).isoformat()
-        user = getpass.getuser()
-
-        entry = f"{timestamp} | {action} | {project_id} | {user} | {details}\n"
-
-        with open(log_path, "a") as f:
-            f.write(entry)
+        entry = f"{_utc_timestamp()} | {action} | {project_id} | {_current_user()} | {details}\n"
 
-        # Enforce permissions on first write
-        if log_path.stat().st_size <= len(entry):
-            log_path.chmod(0o600)
+        _writer.submit(_get_audit_log_path(), entry)
 
     except Exception as e:
         # Audit logging should never block operations
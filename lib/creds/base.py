@@ -23,8 +23,10 @@ Usage:
 
 from __future__ import annotations
 
+import hmac
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Literal, Optional
@@ -35,19 +37,28 @@ logger = logging.getLogger(__name__)
 class SecretsError(Exception):
     """Base exception for secrets-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ProviderNotAvailableError(SecretsError):
     """Raised when a secrets provider is not configured or available."""
 
-    pass
+    __slots__ = ()
 
 
 class SecretNotFoundError(SecretsError):
     """Raised when a requested secret does not exist."""
 
-    pass
+    __slots__ = ()
+
+
+# Precomputed display strings so masked output never rebuilds a string
+_REPR_MASKED = "SecretValue('****')"
+_REPR_NONE = "SecretValue(None)"
+_STR_MASKED = "****"
+
+# Shared instances for the None/"" states, populated after the class body.
+_EMPTY_SECRETS: Dict[Optional[str], SecretValue] = {}
 
 
 class SecretValue:
@@ -56,6 +67,9 @@ class SecretValue:
     The actual value is only accessible via get_secret_value().
     This provides defense-in-depth against accidental credential leaks.
 
+    Instances are immutable. ``SecretValue(None)`` and ``SecretValue("")``
+    return shared instances, so unset fields allocate nothing.
+
     Example:
         >>> password = SecretValue("super_secret_123")
         >>> print(password)
@@ -70,13 +84,25 @@ class SecretValue:
 
     __slots__ = ("_secret_value",)
 
-    def __init__(self, value: Optional[str]) -> None:
-        """Initialize with a secret value.
+    _secret_value: Optional[str]
+
+    def __new__(cls, value: Optional[str]) -> SecretValue:
+        """Create a wrapper for a secret value.
 
         Args:
             value: The actual secret string, or None if not set.
         """
+        if not value and cls is SecretValue:
+            shared = _EMPTY_SECRETS.get(value)
+            if shared is not None:
+                return shared
+        self = object.__new__(cls)
         self._secret_value = value
+        return self
+
+    def __reduce__(self) -> tuple:
+        """Pickle through __new__ so the shared empty instances stay shared."""
+        return (type(self), (self._secret_value,))
 
     def get_secret_value(self) -> Optional[str]:
         """Get the actual secret value.
@@ -91,21 +117,28 @@ class SecretValue:
 
     def __repr__(self) -> str:
         """Return masked representation for debugging."""
-        return "SecretValue('****')" if self._secret_value else "SecretValue(None)"
+        return _REPR_MASKED if self._secret_value else _REPR_NONE
 
     def __str__(self) -> str:
         """Return masked string for display."""
-        return "****" if self._secret_value else ""
+        return _STR_MASKED if self._secret_value else ""
 
     def __bool__(self) -> bool:
         """Check if secret has a value without exposing it."""
         return bool(self._secret_value)
 
     def __eq__(self, other: object) -> bool:
-        """Compare secrets without exposing values in error messages."""
-        if isinstance(other, SecretValue):
-            return self._secret_value == other._secret_value
-        return False
+        """Compare secrets in constant time, without exposing values."""
+        if not isinstance(other, SecretValue):
+            return False
+        a, b = self._secret_value, other._secret_value
+        if a is None or b is None:
+            return a is b
+        # compare_digest only accepts ASCII str, so compare the UTF-8 bytes;
+        # surrogatepass keeps surrogate-escaped env/.env values encodable
+        return hmac.compare_digest(
+            a.encode("utf-8", "surrogatepass"), b.encode("utf-8", "surrogatepass")
+        )
 
     def __hash__(self) -> int:
         """Hash based on value (for use in sets/dicts)."""
@@ -116,7 +149,11 @@ class SecretValue:
         return len(self._secret_value) if self._secret_value else 0
 
 
-@dataclass
+_EMPTY_SECRETS[None] = SecretValue(None)
+_EMPTY_SECRETS[""] = SecretValue("")
+
+
+@dataclass(slots=True)
 class SecretBundle:
     """A collection of key-value secrets for a project.
 
@@ -130,11 +167,15 @@ class SecretBundle:
     version: str | None = None
     updated_at: datetime | None = None
     provider: str = ""
+    # Last __str__ output, tagged with the project id and key set it showed
+    _str_cache: tuple[str, frozenset[str], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def keys(self) -> list[str]:
         """List all secret key names."""
-        return list(self.secrets.keys())
+        return list(self.secrets)
 
     def get(self, key: str) -> str | None:
         """Get a secret value by key."""
@@ -147,11 +188,12 @@ class SecretBundle:
 
     def delete(self, key: str) -> bool:
         """Delete a secret key. Returns True if it existed."""
-        if key in self.secrets:
+        try:
             del self.secrets[key]
-            self.updated_at = datetime.now(timezone.utc)
-            return True
-        return False
+        except KeyError:
+            return False
+        self.updated_at = datetime.now(timezone.utc)
+        return True
 
     def __len__(self) -> int:
         return len(self.secrets)
@@ -161,13 +203,28 @@ class SecretBundle:
         return f"SecretBundle(project_id={self.project_id!r}, keys=[{keys}])"
 
     def __str__(self) -> str:
-        lines = [f"Project: {self.project_id} ({len(self.secrets)} secrets)"]
-        for key in sorted(self.secrets):
-            lines.append(f"  {key} = ****")
-        return "\n".join(lines)
-
-
-@dataclass(frozen=True)
+        # Only key names are rendered, so the output is reusable until the
+        # key set changes - checked against the dict itself, since callers
+        # also edit .secrets directly rather than through set()/delete().
+        cached = self._str_cache
+        if (
+            cached is not None
+            and cached[0] == self.project_id
+            and cached[1] == self.secrets.keys()
+        ):
+            return cached[2]
+
+        keys = sorted(self.secrets)
+        lines = [""] * (len(keys) + 1)
+        lines[0] = f"Project: {self.project_id} ({len(keys)} secrets)"
+        for i, key in enumerate(keys, 1):
+            lines[i] = f"  {key} = ****"
+        rendered = "\n".join(lines)
+        self._str_cache = (self.project_id, frozenset(keys), rendered)
+        return rendered
+
+
+@dataclass(frozen=True, slots=True)
 class ProviderCaps:
     """Capability flags for a secrets provider."""
 
@@ -293,6 +350,35 @@ class BundleProvider(SecretsProvider):
         """
         pass
 
+    def cache_scope(self) -> tuple[str, ...]:
+        """Identify the account and credentials bundles are read with.
+
+        Persistent caches key on this alongside the project ID so a
+        bundle fetched under one identity is never served under another.
+        Providers whose reads do not depend on ambient credentials can
+        keep the empty default.
+        """
+        return ()
+
+    def get_bundles(self, project_ids: list[str]) -> Dict[str, SecretBundle]:
+        """Get the latest bundles for several projects.
+
+        Fetches run concurrently in a thread pool; providers with a
+        batched backend API may override this.
+
+        Args:
+            project_ids: The project identifiers. Duplicates are fetched once.
+
+        Returns:
+            Dictionary mapping each project ID to its bundle.
+        """
+        ids = list(dict.fromkeys(project_ids))
+        if len(ids) <= 1:
+            return {project_id: self.get_bundle(project_id) for project_id in ids}
+
+        with ThreadPoolExecutor(max_workers=min(32, len(ids))) as pool:
+            return dict(zip(ids, pool.map(self.get_bundle, ids)))
+
     @abstractmethod
     def put_bundle(
         self,
@@ -36,11 +36,19 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import os
+import socket
 import subprocess
 import sys
-from typing import NoReturn
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NoReturn, TextIO
+
+if TYPE_CHECKING:
+    from .base import SecretBundle
 
 # ANSI color codes
 RED = "\033[0;31m"
@@ -49,42 +57,83 @@ YELLOW = "\033[0;33m"
 NC = "\033[0m"  # No Color
 
 
-def print_status(status: str, message: str) -> None:
-    """Print a status message with color coding."""
-    symbols = {
+# Colorize only when stdout is a terminal, so pipes and CI logs stay plain
+if sys.stdout is not None and sys.stdout.isatty():
+    STATUS_SYMBOLS = {
         "ok": f"{GREEN}✓{NC}",
         "warn": f"{YELLOW}!{NC}",
         "fail": f"{RED}✗{NC}",
         "info": " ",
     }
-    symbol = symbols.get(status, " ")
-    print(f"{symbol} {message}")
+else:
+    STATUS_SYMBOLS = {"ok": "✓", "warn": "!", "fail": "✗", "info": " "}
+
+
+def print_status(status: str, message: str, file: TextIO | None = None) -> None:
+    """Print a status message with color coding."""
+    symbol = STATUS_SYMBOLS.get(status, " ")
+    print(f"{symbol} {message}", file=file)
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _mask_value(value: str) -> str:
+    """Mask a secret for display, keeping its first and last two characters."""
+    if len(value) <= 4:
+        return "****"
+    return f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
 
 
 def cmd_get(args: argparse.Namespace) -> int:
     """Handle the 'get' subcommand."""
     from . import get_credentials, get_provider
-    from .providers import AWSSecretsProvider, EnvSecretsProvider
 
-    # Select provider
+    # Select provider (import only the one requested; AWS pulls in boto3)
     if args.provider == "aws":
+        from .providers.aws import AWSSecretsProvider
+
         provider = AWSSecretsProvider()
         if not provider.is_available():
             print("Error: AWS Secrets Manager not available", file=sys.stderr)
             return 1
     elif args.provider == "env":
+        from .providers.env import EnvSecretsProvider
+
         provider = EnvSecretsProvider()
     else:
         provider = get_provider()
 
+    secret_ids = list(dict.fromkeys(args.secret_id))
     try:
-        creds = get_credentials(args.secret_id, provider=provider)
+        # AWS fetches several secrets in batched calls; get_credentials()
+        # below then reads them from the provider's cache
+        if len(secret_ids) > 1 and hasattr(provider, "get_secrets"):
+            provider.get_secrets(secret_ids)
+        results = {
+            secret_id: get_credentials(secret_id, provider=provider)
+            for secret_id in secret_ids
+        }
 
         if args.json:
-            print(json.dumps(creds.dsn_masked, indent=2))
-        else:
-            print(f"Provider: {provider.name}")
-            print(f"Secret ID: {args.secret_id}")
+            if len(results) == 1:
+                (creds,) = results.values()
+                print(_dumps_json(creds.dsn_masked))
+            else:
+                print(_dumps_json({
+                    secret_id: creds.dsn_masked for secret_id, creds in results.items()
+                }))
+            return 0
+
+        print(f"Provider: {provider.name}")
+        for secret_id, creds in results.items():
+            print(f"Secret ID: {secret_id}")
             print()
             print(f"Host: {creds.host}")
             print(f"Port: {creds.port}")
@@ -93,6 +142,8 @@ def cmd_get(args: argparse.Namespace) -> int:
             print("Password: ****")
             print()
             print(f"Connection String: {creds.connection_string}")
+            if len(results) > 1:
+                print()
 
         return 0
 
@@ -123,10 +174,21 @@ def cmd_set(args: argparse.Namespace) -> int:
     return 0
 
 
+def _print_bundle(bundle: SecretBundle, provider_name: str) -> None:
+    """Print a bundle's keys with masked values in a single write."""
+    lines = [
+        f"Project: {bundle.project_id}",
+        f"Provider: {provider_name}",
+        f"Secrets: {len(bundle.secrets)}",
+        "",
+    ]
+    lines.extend(f"  {key} = {_mask_value(value)}" for key, value in sorted(bundle.secrets.items()))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def cmd_list(args: argparse.Namespace) -> int:
     """Handle the 'list' subcommand."""
     from .project import get_project_id
-    from .providers.aws import AWSSecretsProvider
     from .providers.dotenv import DotEnvSecretsProvider
 
     project_id = args.project or get_project_id()
@@ -136,29 +198,17 @@ def cmd_list(args: argparse.Namespace) -> int:
     bundle = dotenv.get_bundle(project_id)
 
     if bundle.secrets:
-        print(f"Project: {project_id}")
-        print(f"Provider: {dotenv.name}")
-        print(f"Secrets: {len(bundle.secrets)}")
-        print()
-        for key in sorted(bundle.secrets):
-            value = bundle.secrets[key]
-            masked = value[:2] + "*" * max(0, len(value) - 4) + value[-2:] if len(value) > 4 else "****"
-            print(f"  {key} = {masked}")
+        _print_bundle(bundle, dotenv.name)
         return 0
 
-    # Try AWS
+    # Try AWS (imported only now, so dotenv-only listings skip boto3)
+    from .providers.aws import AWSSecretsProvider
+
     aws = AWSSecretsProvider()
     if aws.is_available():
         bundle = aws.get_bundle(project_id)
         if bundle.secrets:
-            print(f"Project: {project_id}")
-            print(f"Provider: {aws.name}")
-            print(f"Secrets: {len(bundle.secrets)}")
-            print()
-            for key in sorted(bundle.secrets):
-                value = bundle.secrets[key]
-                masked = value[:2] + "*" * max(0, len(value) - 4) + value[-2:] if len(value) > 4 else "****"
-                print(f"  {key} = {masked}")
+            _print_bundle(bundle, aws.name)
             return 0
 
     print(f"No secrets found for project '{project_id}'")
@@ -183,6 +233,7 @@ def cmd_run(args: argparse.Namespace) -> int:
         command=cmd,
         project_id=args.project,
         provider_name=args.provider,
+        exec_replace=True,
     )
 
 
@@ -274,145 +325,216 @@ def cmd_rotate(args: argparse.Namespace) -> int:
     return 0
 
 
-def validate_env() -> bool:
+def validate_env(out: TextIO | None = None) -> bool:
     """Validate environment variables."""
-    print("=== Environment Variables ===")
-    print()
+    print("=== Environment Variables ===", file=out)
+    print(file=out)
 
     # Check for common database env vars
-    if os.environ.get("DB_HOST"):
-        print_status("ok", f"DB_HOST is set: {os.environ['DB_HOST']}")
-    else:
-        print_status("warn", "DB_HOST is not set")
+    for name in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+        if value := os.environ.get(name):
+            shown = "****" if name == "DB_PASSWORD" else value
+            print_status("ok", f"{name} is set: {shown}", out)
+        else:
+            print_status("warn", f"{name} is not set", out)
 
-    if os.environ.get("DB_USER"):
-        print_status("ok", f"DB_USER is set: {os.environ['DB_USER']}")
+    if os.path.isfile(".env"):
+        print_status("ok", ".env file exists", out)
     else:
-        print_status("warn", "DB_USER is not set")
+        print_status("warn", ".env file not found (optional)", out)
 
-    if os.environ.get("DB_PASSWORD"):
-        print_status("ok", "DB_PASSWORD is set: ****")
-    else:
-        print_status("warn", "DB_PASSWORD is not set")
+    print(file=out)
+    return True
 
-    if os.environ.get("DB_NAME"):
-        print_status("ok", f"DB_NAME is set: {os.environ['DB_NAME']}")
-    else:
-        print_status("warn", "DB_NAME is not set")
 
-    if os.path.isfile(".env"):
-        print_status("ok", ".env file exists")
-    else:
-        print_status("warn", ".env file not found (optional)")
+def _check_aws_identity(region: str, out: TextIO | None = None) -> None:
+    """Validate AWS credentials with an STS GetCallerIdentity call via boto3."""
+    from botocore.config import Config
 
-    print()
-    return True
+    from .providers import aws as aws_provider
+
+    boto3 = aws_provider._load_boto3()
+    try:
+        sts = boto3.client(
+            "sts",
+            region_name=region,
+            config=Config(connect_timeout=5, read_timeout=10, retries={"max_attempts": 1}),
+        )
+        identity = sts.get_caller_identity().get("Arn") or "unknown"
+        print_status("ok", f"AWS credentials valid: {identity}", out)
+    except (aws_provider.ClientError, aws_provider.NoCredentialsError):
+        print_status("fail", "AWS credentials invalid or expired", out)
+    except Exception as e:
+        print_status("fail", f"Error validating AWS: {e}", out)
 
 
-def validate_aws() -> bool:
-    """Validate AWS credentials."""
-    print("=== AWS Credentials ===")
-    print()
+def validate_aws(out: TextIO | None = None, env: Mapping[str, str] | None = None) -> bool:
+    """Validate AWS credentials.
+
+    ``env`` defaults to a snapshot of os.environ taken on entry, so the
+    checks see one consistent set of variables.
+    """
+    print("=== AWS Credentials ===", file=out)
+    print(file=out)
 
     # Check for AWS env vars
-    aws_key = os.environ.get("AWS_ACCESS_KEY_ID", "")
+    if env is None:
+        env = dict(os.environ)
+    aws_key = env.get("AWS_ACCESS_KEY_ID", "")
     if aws_key:
         key_prefix = aws_key[:4] if len(aws_key) >= 4 else aws_key
-        print_status("ok", f"AWS_ACCESS_KEY_ID is set: {key_prefix}...")
+        print_status("ok", f"AWS_ACCESS_KEY_ID is set: {key_prefix}...", out)
     else:
-        print_status("warn", "AWS_ACCESS_KEY_ID not set")
+        print_status("warn", "AWS_ACCESS_KEY_ID not set", out)
 
-    if os.environ.get("AWS_SECRET_ACCESS_KEY"):
-        print_status("ok", "AWS_SECRET_ACCESS_KEY is set: ****")
+    if env.get("AWS_SECRET_ACCESS_KEY"):
+        print_status("ok", "AWS_SECRET_ACCESS_KEY is set: ****", out)
     else:
-        print_status("warn", "AWS_SECRET_ACCESS_KEY not set")
+        print_status("warn", "AWS_SECRET_ACCESS_KEY not set", out)
 
-    region = os.environ.get("AWS_DEFAULT_REGION")
+    region = env.get("AWS_DEFAULT_REGION")
     if region:
-        print_status("ok", f"AWS_DEFAULT_REGION: {region}")
+        print_status("ok", f"AWS_DEFAULT_REGION: {region}", out)
     else:
-        print_status("info", "AWS_DEFAULT_REGION not set (defaults to us-east-1)")
+        print_status("info", "AWS_DEFAULT_REGION not set (defaults to us-east-1)", out)
 
-    # Try to validate AWS credentials using CLI
-    try:
-        result = subprocess.run(
-            ["aws", "sts", "get-caller-identity", "--query", "Arn", "--output", "text"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            identity = result.stdout.strip() or "unknown"
-            print_status("ok", f"AWS credentials valid: {identity}")
-        else:
-            print_status("fail", "AWS credentials invalid or expired")
-    except FileNotFoundError:
-        print_status("warn", "AWS CLI not installed (cannot validate credentials)")
-    except subprocess.TimeoutExpired:
-        print_status("warn", "AWS CLI timed out")
-    except Exception as e:
-        print_status("fail", f"Error validating AWS: {e}")
+    from .providers import aws as aws_provider
 
-    print()
+    if aws_provider.BOTO3_AVAILABLE:
+        # Ask STS in-process rather than spawning the AWS CLI
+        _check_aws_identity(region or "us-east-1", out)
+    else:
+        # Try to validate AWS credentials using CLI
+        try:
+            result = subprocess.run(
+                ["aws", "sts", "get-caller-identity", "--query", "Arn", "--output", "text"],
+                # Only the ARN on stdout is used
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8",
+                # Without credentials the CLI falls through to the EC2
+                # metadata service, which retries for a long time off-EC2
+                env={
+                    **env,
+                    "AWS_METADATA_SERVICE_TIMEOUT": "1",
+                    "AWS_METADATA_SERVICE_NUM_ATTEMPTS": "1",
+                },
+                timeout=10,
+            )
+            if result.returncode == 0:
+                identity = result.stdout.strip() or "unknown"
+                print_status("ok", f"AWS credentials valid: {identity}", out)
+            else:
+                print_status("fail", "AWS credentials invalid or expired", out)
+        except FileNotFoundError:
+            print_status("warn", "AWS CLI not installed (cannot validate credentials)", out)
+        except subprocess.TimeoutExpired:
+            print_status("warn", "AWS CLI timed out", out)
+        except Exception as e:
+            print_status("fail", f"Error validating AWS: {e}", out)
+
+    print(file=out)
     return True
 
 
-def validate_db() -> bool:
-    """Validate database connection."""
-    print("=== Database Connection ===")
-    print()
+# PostgreSQL SSLRequest packet: length 8, request code 80877103
+_PG_SSL_REQUEST = b"\x00\x00\x00\x08\x04\xd2\x16\x2f"
+
+
+def _probe_postgres(host: str, port: int, timeout: float = 3) -> bool:
+    """Connect to host:port and check that a PostgreSQL server answers.
+
+    Sends an SSLRequest, which a PostgreSQL server answers with a single
+    b"S" or b"N" before any authentication.
+
+    Returns:
+        True if the reply looks like PostgreSQL, False if something else
+        accepted the connection.
+
+    Raises:
+        OSError: If the port cannot be reached.
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        try:
+            sock.sendall(_PG_SSL_REQUEST)
+            return sock.recv(1) in (b"S", b"N")
+        except OSError:
+            return False
+
+
+def validate_db(out: TextIO | None = None, deep: bool = False) -> bool:
+    """Validate database connection.
+
+    Checks that a PostgreSQL server answers on the database port; with
+    ``deep``, also logs in and runs ``SELECT 1`` through psql.
+    """
+    print("=== Database Connection ===", file=out)
+    print(file=out)
 
     try:
         from . import get_credentials
 
         creds = get_credentials()
-        print_status("ok", f"Credentials loaded: {creds.connection_string}")
+        print_status("ok", f"Credentials loaded: {creds.connection_string}", out)
 
-        # Try actual connection if psql is available
         host = os.environ.get("DB_HOST", "localhost")
         port = os.environ.get("DB_PORT", "5432")
         dbname = os.environ.get("DB_NAME", "")
         user = os.environ.get("DB_USER", "")
         password = os.environ.get("DB_PASSWORD", "")
 
-        if dbname and user:
-            try:
-                result = subprocess.run(
-                    [
-                        "psql",
-                        "-h", host,
-                        "-p", port,
-                        "-U", user,
-                        "-d", dbname,
-                        "-c", "SELECT 1",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    env={**os.environ, "PGPASSWORD": password},
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    print_status("ok", "Database connection successful")
-                else:
-                    print_status("fail", "Database connection failed")
-            except FileNotFoundError:
-                print_status("info", "psql not installed (cannot test connection)")
-            except subprocess.TimeoutExpired:
-                print_status("fail", "Database connection timed out")
+        # A socket-level probe answers "is it reachable" without spawning
+        # psql; the authenticated query only runs with --deep
+        try:
+            is_postgres = _probe_postgres(host, int(port))
+        except (OSError, ValueError) as e:
+            print_status("fail", f"Database not reachable at {host}:{port} ({e})", out)
         else:
-            print_status("info", "DB_NAME or DB_USER not set (cannot test connection)")
+            if is_postgres:
+                print_status("ok", f"PostgreSQL reachable at {host}:{port}", out)
+            else:
+                print_status("warn", f"{host}:{port} is reachable but did not answer as PostgreSQL", out)
+            if not deep:
+                print_status("info", "Use --deep to test login with psql", out)
+            elif dbname and user:
+                try:
+                    result = subprocess.run(
+                        [
+                            "psql",
+                            "-h", host,
+                            "-p", port,
+                            "-U", user,
+                            "-d", dbname,
+                            "-c", "SELECT 1",
+                        ],
+                        # Only the exit status matters
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        env={**os.environ, "PGPASSWORD": password, "PGCONNECT_TIMEOUT": "3"},
+                        timeout=10,
+                    )
+                    if result.returncode == 0:
+                        print_status("ok", "Database connection successful", out)
+                    else:
+                        print_status("fail", "Database connection failed", out)
+                except FileNotFoundError:
+                    print_status("info", "psql not installed (cannot test connection)", out)
+                except subprocess.TimeoutExpired:
+                    print_status("fail", "Database connection timed out", out)
+            else:
+                print_status("info", "DB_NAME or DB_USER not set (cannot test connection)", out)
 
     except Exception as e:
-        print_status("fail", f"Failed to load credentials: {e}")
+        print_status("fail", f"Failed to load credentials: {e}", out)
 
-    print()
+    print(file=out)
     return True
 
 
-def validate_dotenv() -> bool:
+def validate_dotenv(out: TextIO | None = None) -> bool:
     """Validate DotEnv global config secrets."""
-    print("=== Global Config Secrets ===")
-    print()
+    print("=== Global Config Secrets ===", file=out)
+    print(file=out)
 
     try:
         from .project import get_project_id
@@ -422,21 +544,22 @@ def validate_dotenv() -> bool:
         provider = DotEnvSecretsProvider()
         bundle = provider.get_bundle(project_id)
 
-        print_status("ok", f"Project ID: {project_id}")
+        print_status("ok", f"Project ID: {project_id}", out)
 
         if bundle.secrets:
-            print_status("ok", f"Found {len(bundle.secrets)} secrets")
-            for key in sorted(bundle.secrets):
-                print_status("info", f"  {key}")
+            print_status("ok", f"Found {len(bundle.secrets)} secrets", out)
+            info = STATUS_SYMBOLS["info"]
+            lines = "".join(f"{info}   {key}\n" for key in sorted(bundle.secrets))
+            (out or sys.stdout).write(lines)
         else:
-            print_status("warn", "No secrets stored yet")
-            print_status("info", "  Use 'creds set KEY VALUE' to add secrets")
+            print_status("warn", "No secrets stored yet", out)
+            print_status("info", "  Use 'creds set KEY VALUE' to add secrets", out)
     except RuntimeError as e:
-        print_status("warn", f"Not in a git repository: {e}")
+        print_status("warn", f"Not in a git repository: {e}", out)
     except Exception as e:
-        print_status("fail", f"Error: {e}")
+        print_status("fail", f"Error: {e}", out)
 
-    print()
+    print(file=out)
     return True
 
 
@@ -447,23 +570,41 @@ def cmd_validate(args: argparse.Namespace) -> int:
     elif args.aws:
         validate_aws()
     elif args.db:
-        validate_db()
+        validate_db(deep=args.deep)
     elif args.dotenv:
         validate_dotenv()
     else:
-        # Validate all
-        validate_dotenv()
-        validate_env()
-        validate_aws()
-        validate_db()
+        # Validate all. The AWS and database probes can wait on the
+        # network for several seconds, so run every check concurrently into its own buffer
+        # and print the buffers in a fixed order.
+        checks = (
+            validate_dotenv,
+            validate_env,
+            validate_aws,
+            functools.partial(validate_db, deep=args.deep),
+        )
+        buffers = [io.StringIO() for _ in checks]
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            for future in [pool.submit(check, buf) for check, buf in zip(checks, buffers)]:
+                future.result()
+        sys.stdout.write("".join(buf.getvalue() for buf in buffers))
         print("=== Summary ===")
         print("Run with --dotenv, --db, --aws, or --env for specific validation")
 
     return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+@functools.lru_cache(maxsize=None)
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser (built once per process and command).
+
+    Every subcommand is registered so top-level help lists them all, but
+    only ``command``'s own arguments are added; None builds them all.
+    """
+
+    def wants(name: str) -> bool:
+        return command is None or command == name
+
     parser = argparse.ArgumentParser(
         prog="python -m lib.creds",
         description="Secrets management CLI with provider abstraction and masking",
@@ -471,98 +612,98 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
+    # Shared by every subcommand that works on a project's secrets
+    project_parent = argparse.ArgumentParser(add_help=False)
+    project_parent.add_argument(
+        "--project",
+        help="Override auto-detected project ID",
+    )
+
     # 'get' subcommand
     get_parser = subparsers.add_parser(
         "get",
         help="Get credentials (masked output)",
         description="Get database credentials from the configured provider. "
+        "Several secret IDs may be given; AWS fetches them in batches. "
         "Passwords are always masked in output.",
     )
-    get_parser.add_argument(
-        "secret_id",
-        nargs="?",
-        default="DB",
-        help="Secret identifier (default: DB)",
-    )
-    get_parser.add_argument(
-        "--provider",
-        "-p",
-        choices=["aws", "env", "auto"],
-        default="auto",
-        help="Provider to use: aws, env, or auto (default: auto)",
-    )
-    get_parser.add_argument(
-        "--json",
-        "-j",
-        action="store_true",
-        help="Output as JSON (masked)",
-    )
+    if wants("get"):
+        get_parser.add_argument(
+            "secret_id",
+            nargs="*",
+            default=["DB"],
+            help="Secret identifiers (default: DB)",
+        )
+        get_parser.add_argument(
+            "--provider",
+            "-p",
+            choices=["aws", "env", "auto"],
+            default="auto",
+            help="Provider to use: aws, env, or auto (default: auto)",
+        )
+        get_parser.add_argument(
+            "--json",
+            "-j",
+            action="store_true",
+            help="Output as JSON (masked)",
+        )
 
     # 'set' subcommand
     set_parser = subparsers.add_parser(
         "set",
+        parents=[project_parent],
         help="Set a secret value",
         description="Set or update a secret in the project's global config store.",
     )
-    set_parser.add_argument("key", help="Secret key name (e.g., DB_PASSWORD)")
-    set_parser.add_argument("value", help="Secret value")
-    set_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
+    if wants("set"):
+        set_parser.add_argument("key", help="Secret key name (e.g., DB_PASSWORD)")
+        set_parser.add_argument("value", help="Secret value")
 
     # 'delete' subcommand
     delete_parser = subparsers.add_parser(
         "delete",
+        parents=[project_parent],
         help="Delete a secret key",
         description="Remove a secret from the project's store. "
         "Requires confirmation unless --force is used.",
     )
-    delete_parser.add_argument("key", help="Secret key name to delete (e.g., DB_PASSWORD)")
-    delete_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
-    delete_parser.add_argument(
-        "--force",
-        "-f",
-        action="store_true",
-        help="Skip confirmation prompt",
-    )
+    if wants("delete"):
+        delete_parser.add_argument("key", help="Secret key name to delete (e.g., DB_PASSWORD)")
+        delete_parser.add_argument(
+            "--force",
+            "-f",
+            action="store_true",
+            help="Skip confirmation prompt",
+        )
 
     # 'list' subcommand
-    list_parser = subparsers.add_parser(
+    subparsers.add_parser(
         "list",
+        parents=[project_parent],
         help="List secret keys (values masked)",
         description="List all secrets for the current project.",
     )
-    list_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
 
     # 'run' subcommand
     run_parser = subparsers.add_parser(
         "run",
+        parents=[project_parent],
         help="Run command with secrets injected",
         description="Execute a command with project secrets as env vars. "
         "Secrets never appear in CLI arguments.",
     )
-    run_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
-    run_parser.add_argument(
-        "--provider",
-        choices=["aws", "dotenv", "auto"],
-        default=None,
-        help="Provider to use (default: auto)",
-    )
-    run_parser.add_argument(
-        "run_command",
-        nargs=argparse.REMAINDER,
-        help="Command to run (use -- before command)",
-    )
+    if wants("run"):
+        run_parser.add_argument(
+            "--provider",
+            choices=["aws", "dotenv", "auto"],
+            default=None,
+            help="Provider to use (default: auto)",
+        )
+        run_parser.add_argument(
+            "run_command",
+            nargs=argparse.REMAINDER,
+            help="Command to run (use -- before command)",
+        )
 
     # 'validate' subcommand
     validate_parser = subparsers.add_parser(
@@ -571,92 +712,99 @@ def create_parser() -> argparse.ArgumentParser:
         description="Validate that credentials are properly configured. "
         "Never displays actual secret values.",
     )
-    validate_parser.add_argument(
-        "--env",
-        action="store_true",
-        help="Validate environment variables only",
-    )
-    validate_parser.add_argument(
-        "--aws",
-        action="store_true",
-        help="Validate AWS credentials only",
-    )
-    validate_parser.add_argument(
-        "--db",
-        action="store_true",
-        help="Test database connection only",
-    )
-    validate_parser.add_argument(
-        "--dotenv",
-        action="store_true",
-        help="Validate global config secrets only",
-    )
+    if wants("validate"):
+        validate_parser.add_argument(
+            "--env",
+            action="store_true",
+            help="Validate environment variables only",
+        )
+        validate_parser.add_argument(
+            "--aws",
+            action="store_true",
+            help="Validate AWS credentials only",
+        )
+        validate_parser.add_argument(
+            "--db",
+            action="store_true",
+            help="Test database connection only",
+        )
+        validate_parser.add_argument(
+            "--deep",
+            action="store_true",
+            help="Also log in to the database with psql (default: reachability only)",
+        )
+        validate_parser.add_argument(
+            "--dotenv",
+            action="store_true",
+            help="Validate global config secrets only",
+        )
 
     # 'ui' subcommand
     ui_parser = subparsers.add_parser(
         "ui",
+        parents=[project_parent],
         help="Launch web UI for secrets management",
         description="Start a local web server for managing secrets. "
         "Binds to localhost only with bearer token auth.",
     )
-    ui_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
-    ui_parser.add_argument(
-        "--host",
-        default=None,
-        help="Bind host (default: 127.0.0.1)",
-    )
-    ui_parser.add_argument(
-        "--port",
-        type=int,
-        default=None,
-        help="Bind port (default: 8090)",
-    )
+    if wants("ui"):
+        ui_parser.add_argument(
+            "--host",
+            default=None,
+            help="Bind host (default: 127.0.0.1)",
+        )
+        ui_parser.add_argument(
+            "--port",
+            type=int,
+            default=None,
+            help="Bind port (default: 8090)",
+        )
 
     # 'rotate' subcommand
     rotate_parser = subparsers.add_parser(
         "rotate",
+        parents=[project_parent],
         help="Rotate a secret value",
         description="Update a secret with a new value.",
     )
-    rotate_parser.add_argument("key", help="Secret key to rotate")
-    rotate_parser.add_argument(
-        "value",
-        nargs="?",
-        default=None,
-        help="New value (prompts if not provided)",
-    )
-    rotate_parser.add_argument(
-        "--project",
-        help="Override auto-detected project ID",
-    )
+    if wants("rotate"):
+        rotate_parser.add_argument("key", help="Secret key to rotate")
+        rotate_parser.add_argument(
+            "value",
+            nargs="?",
+            default=None,
+            help="New value (prompts if not provided)",
+        )
 
     return parser
 
 
+COMMANDS = {
+    "get": cmd_get,
+    "set": cmd_set,
+    "delete": cmd_delete,
+    "list": cmd_list,
+    "run": cmd_run,
+    "validate": cmd_validate,
+    "ui": cmd_ui,
+    "rotate": cmd_rotate,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Only the invoked subcommand needs its arguments built
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    parser = create_parser(command)
     args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
         return 0
 
-    commands = {
-        "get": cmd_get,
-        "set": cmd_set,
-        "delete": cmd_delete,
-        "list": cmd_list,
-        "run": cmd_run,
-        "validate": cmd_validate,
-        "ui": cmd_ui,
-        "rotate": cmd_rotate,
-    }
-
-    handler = commands.get(args.command)
+    handler = COMMANDS.get(args.command)
     if handler:
         return handler(args)
 
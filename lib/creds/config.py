@@ -14,12 +14,16 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# Parsed config files: {path: ((mtime_ns, size), config)}
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], SecretsConfig]] = {}
+
+
 @dataclass
 class SecretsConfig:
     """Configuration for the secrets management system."""
@@ -34,6 +38,10 @@ class SecretsConfig:
     # UI settings
     ui_host: str = "127.0.0.1"
     ui_port: int = 8090
+    # Seconds the UI reuses a fetched bundle (0 disables)
+    ui_cache_ttl: float = 10.0
+    # Threads for the UI's blocking provider calls
+    ui_io_workers: int = 4
 
     # Rotation settings
     rotation_warn_days: int = 90
@@ -42,6 +50,8 @@ class SecretsConfig:
     def load(cls, project_root: str | None = None) -> SecretsConfig:
         """Load config from .claude/secrets.yml or return defaults.
 
+        The parsed file is cached until its mtime or size changes.
+
         Args:
             project_root: Project root directory. Defaults to cwd.
 
@@ -53,10 +63,19 @@ class SecretsConfig:
 
         config_path = Path(project_root) / ".claude" / "secrets.yml"
 
-        if config_path.exists():
-            return cls._from_yaml(config_path)
+        try:
+            stat = config_path.stat()
+        except OSError:
+            return cls()
 
-        return cls()
+        # Reuse the parsed file until it changes on disk; hand out copies
+        # so callers cannot mutate the cached instance
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, cls._from_yaml(config_path))
+            _CONFIG_CACHE[config_path] = cached
+        return replace(cached[1])
 
     @classmethod
     def _from_yaml(cls, path: Path) -> SecretsConfig:
@@ -79,5 +98,7 @@ class SecretsConfig:
             aws_role_arn=data.get("aws", {}).get("role_arn", ""),
             ui_host=data.get("ui", {}).get("host", "127.0.0.1"),
             ui_port=data.get("ui", {}).get("port", 8090),
+            ui_cache_ttl=data.get("ui", {}).get("cache_ttl", 10.0),
+            ui_io_workers=data.get("ui", {}).get("io_workers", 4),
             rotation_warn_days=data.get("rotation", {}).get("warn_days", 90),
         )
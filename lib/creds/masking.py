@@ -98,6 +98,56 @@ SECRET_PATTERNS: List[Tuple[str, Optional[str]]] = [
 ]
 
 
+CompiledRule = Tuple[re.Pattern[str], Optional[str]]
+
+# Numbered/named backreferences would point at the wrong group once a
+# pattern is embedded in the alternation
+_BACKREF_RE = re.compile(r"(?<!\\)\\(?:[1-9]|g<)|\(\?P=")
+
+
+def _compile_rules(patterns: List[Tuple[str, Optional[str]]]) -> List[CompiledRule]:
+    """Compile (pattern, replacement) pairs, skipping invalid patterns."""
+    compiled: List[CompiledRule] = []
+    for pattern, replacement in patterns:
+        try:
+            compiled.append((re.compile(pattern, re.IGNORECASE), replacement))
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {pattern}: {e}")
+    return compiled
+
+
+def _build_alternation(indexed: List[Tuple[int, re.Pattern[str]]]) -> Optional[re.Pattern[str]]:
+    """Join compiled patterns into one alternation of ``_p{index}`` groups.
+
+    The alternation only answers "does any pattern match?" in one pass;
+    replacements are still applied pattern by pattern. Returns None if a
+    pattern cannot be embedded (backreferences, inline global flags); the
+    caller then skips the pre-check.
+    """
+    if not indexed or any(_BACKREF_RE.search(c.pattern) for _, c in indexed):
+        return None
+    joined = "|".join(f"(?P<_p{i}>{compiled.pattern})" for i, compiled in indexed)
+    try:
+        return re.compile(joined, re.IGNORECASE)
+    except re.error:
+        logger.debug("Pattern alternation failed to compile, using sequential matching")
+        return None
+
+
+def _build_alternations(
+    compiled: List[CompiledRule],
+) -> Tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]]]:
+    """Build the (mask, scan) alternations; masking skips detection-only rules."""
+    mask_re = _build_alternation([(i, c) for i, (c, r) in enumerate(compiled) if r is not None])
+    scan_re = _build_alternation([(i, c) for i, (c, _) in enumerate(compiled)])
+    return mask_re, scan_re
+
+
+# Default patterns are compiled once at import and shared by every masker
+_DEFAULT_RULES: Tuple[CompiledRule, ...] = tuple(_compile_rules(SECRET_PATTERNS))
+_DEFAULT_MASK_RE, _DEFAULT_SCAN_RE = _build_alternations(list(_DEFAULT_RULES))
+
+
 class OutputMasker:
     """Masks secrets in output strings.
 
@@ -120,13 +170,45 @@ class OutputMasker:
         Args:
             additional_patterns: Extra (pattern, replacement) tuples to use.
         """
-        self.patterns = SECRET_PATTERNS.copy()
+        self._patterns = SECRET_PATTERNS.copy()
         if additional_patterns:
-            self.patterns.extend(additional_patterns)
+            self._patterns.extend(additional_patterns)
 
         # Track explicitly registered secret values
         self._known_secrets: Set[str] = set()
 
+        self._compiled: List[CompiledRule] = list(_DEFAULT_RULES)
+        if additional_patterns:
+            self._compiled.extend(_compile_rules(additional_patterns))
+            self._mask_re, self._scan_re = _build_alternations(self._compiled)
+        else:
+            self._mask_re, self._scan_re = _DEFAULT_MASK_RE, _DEFAULT_SCAN_RE
+
+    @property
+    def patterns(self) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """The (pattern, replacement) pairs in use, read-only.
+
+        Patterns are compiled as they are added, so editing this sequence
+        could not take effect; use add_pattern() instead.
+        """
+        return tuple(self._patterns)
+
+    def add_pattern(self, pattern: str, replacement: Optional[str] = None) -> None:
+        """Add a masking (or, with no replacement, detection-only) pattern.
+
+        Compiles the pattern and rebuilds the combined alternation once.
+
+        Args:
+            pattern: Regular expression (matched case-insensitively).
+            replacement: Substitution template, or None for detection only.
+        """
+        rules = _compile_rules([(pattern, replacement)])
+        if not rules:
+            return
+        self._patterns.append((pattern, replacement))
+        self._compiled.extend(rules)
+        self._mask_re, self._scan_re = _build_alternations(self._compiled)
+
     def register_secret(self, value: Optional[str]) -> None:
         """Register a known secret value for explicit masking.
 
@@ -153,7 +235,7 @@ class OutputMasker:
 
         Order of operations:
         1. Replace explicitly registered secrets
-        2. Apply regex pattern replacements
+        2. Apply regex pattern replacements, one pattern after another
 
         Args:
             text: Input text that may contain secrets.
@@ -172,14 +254,16 @@ class OutputMasker:
             if secret in result:
                 result = result.replace(secret, "****")
 
-        # Then apply pattern-based masking
-        for pattern, replacement in self.patterns:
-            if replacement is None:
-                continue  # Detection-only pattern
-            try:
-                result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern: {pattern}: {e}")
+        # One pass over the text rules out the common clean case. Masking
+        # itself stays sequential: a single leftmost-first alternation lets
+        # a broad match (e.g. a connection string) swallow text that a later
+        # pattern must mask.
+        if self._mask_re is not None and self._mask_re.search(result) is None:
+            return result
+
+        for compiled, replacement in self._compiled:
+            if replacement is not None:
+                result = compiled.sub(replacement, result)
 
         return result
 
@@ -205,9 +289,14 @@ class OutputMasker:
             if secret in text:
                 warnings.append(f"Registered secret found in text (length {len(secret)})")
 
-        # Check patterns
-        for pattern, _ in self.patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        # One pass over the text rules out the common clean case; only
+        # then check patterns individually so overlapping matches all report
+        if self._scan_re is not None and self._scan_re.search(text) is None:
+            return warnings
+
+        for compiled, _ in self._compiled:
+            if compiled.search(text):
+                pattern = compiled.pattern
                 # Truncate pattern for display
                 display_pattern = pattern[:40] + "..." if len(pattern) > 40 else pattern
                 warnings.append(f"Potential secret matching: {display_pattern}")
@@ -42,7 +42,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Any, FrozenSet, Optional, Sequence, Tuple
 
 
 class AccessLevel(Enum):
@@ -117,6 +117,13 @@ def access_level_gte(current: AccessLevel, required: AccessLevel) -> bool:
     return ACCESS_LEVEL_ORDER[current] >= ACCESS_LEVEL_ORDER[required]
 
 
+def _lowered(tables: Optional[Sequence[str]]) -> Optional[FrozenSet[str]]:
+    """Lowercase a table list into a set, preserving None."""
+    if tables is None:
+        return None
+    return frozenset(t.lower() for t in tables)
+
+
 @dataclass
 class PermissionConfig:
     """Permission configuration for a database session.
@@ -140,18 +147,41 @@ class PermissionConfig:
 
         # Admin access (use with caution)
         config = PermissionConfig(access_level=AccessLevel.ADMIN)
+
+    Table and confirmation lists are stored as tuples and indexed into
+    sets whenever they are assigned, so checks are O(1). They cannot be
+    edited in place; assign a new sequence instead, e.g.
+    ``config.denied_tables = [*config.denied_tables, "secrets"]``.
     """
 
     access_level: AccessLevel = AccessLevel.READ_ONLY
-    allowed_tables: Optional[List[str]] = None  # None = all tables allowed
-    denied_tables: Optional[List[str]] = None  # Explicit deny list
-    require_confirmation: List[OperationType] = field(default_factory=list)
+    allowed_tables: Optional[Sequence[str]] = None  # None = all tables allowed
+    denied_tables: Optional[Sequence[str]] = None  # Explicit deny list
+    require_confirmation: Sequence[OperationType] = field(default_factory=tuple)
+
+    # Lookup sets kept in step with the fields above by __setattr__
+    _allowed_lower: Optional[FrozenSet[str]] = field(init=False, repr=False, compare=False)
+    _denied_lower: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _confirm_ops: FrozenSet[OperationType] = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Freeze table/confirmation lists and rebuild their lookup sets."""
+        if name == "allowed_tables":
+            value = None if value is None else tuple(value)
+            object.__setattr__(self, "_allowed_lower", _lowered(value))
+        elif name == "denied_tables":
+            value = None if value is None else tuple(value)
+            object.__setattr__(self, "_denied_lower", _lowered(value) or frozenset())
+        elif name == "require_confirmation":
+            value = tuple(value)
+            object.__setattr__(self, "_confirm_ops", frozenset(value))
+        object.__setattr__(self, name, value)
 
     def __post_init__(self) -> None:
-        """Set default confirmation requirements if not specified."""
+        """Set default confirmation requirements."""
         if not self.require_confirmation:
             # Default: require confirmation for destructive operations
-            self.require_confirmation = [
+            self.require_confirmation = (
                 OperationType.DELETE,
                 OperationType.DROP,
                 OperationType.DROP_DATABASE,
@@ -159,7 +189,7 @@ class PermissionConfig:
                 OperationType.TRUNCATE,
                 OperationType.TRUNCATE_TABLE,
                 OperationType.ALTER,
-            ]
+            )
 
     def can_execute(
         self,
@@ -184,16 +214,15 @@ class PermissionConfig:
 
         # Check table restrictions
         if table:
+            lowered = table.lower()
+
             # Denied tables take precedence
-            if self.denied_tables and table.lower() in [
-                t.lower() for t in self.denied_tables
-            ]:
+            if lowered in self._denied_lower:
                 return False, f"Table '{table}' is in deny list"
 
             # Check allowed tables (if whitelist is set)
-            if self.allowed_tables is not None:
-                if table.lower() not in [t.lower() for t in self.allowed_tables]:
-                    return False, f"Table '{table}' is not in allow list"
+            if self._allowed_lower is not None and lowered not in self._allowed_lower:
+                return False, f"Table '{table}' is not in allow list"
 
         return True, "Allowed"
 
@@ -206,7 +235,7 @@ class PermissionConfig:
         Returns:
             True if user confirmation should be requested.
         """
-        return operation in self.require_confirmation
+        return operation in self._confirm_ops
 
     def describe(self) -> str:
         """Return human-readable description of permissions.
@@ -231,7 +260,7 @@ class PermissionConfig:
         return "\n".join(lines)
 
     @classmethod
-    def read_only(cls, tables: Optional[List[str]] = None) -> "PermissionConfig":
+    def read_only(cls, tables: Optional[Sequence[str]] = None) -> "PermissionConfig":
         """Create read-only configuration.
 
         Args:
@@ -245,8 +274,8 @@ class PermissionConfig:
     @classmethod
     def read_write(
         cls,
-        tables: Optional[List[str]] = None,
-        denied_tables: Optional[List[str]] = None,
+        tables: Optional[Sequence[str]] = None,
+        denied_tables: Optional[Sequence[str]] = None,
     ) -> "PermissionConfig":
         """Create read-write configuration.
 
@@ -276,5 +305,5 @@ class PermissionConfig:
         """
         config = cls(access_level=AccessLevel.ADMIN)
         if not require_confirmation:
-            config.require_confirmation = []
+            config.require_confirmation = ()
         return config
@@ -13,17 +13,47 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
 import subprocess
 from pathlib import Path
 
+# Set by ``run_with_secrets`` for child processes (and settable by hand) so
+# nested invocations skip repository detection. Both are honoured only while
+# the working directory is inside PROJECT_ROOT_ENV, so a shell started under
+# ``creds run`` that moves to another repository detects that one instead.
+PROJECT_ID_ENV = "CLAUDE_POWER_PACK_PROJECT_ID"
+PROJECT_ROOT_ENV = "CLAUDE_POWER_PACK_PROJECT_ROOT"
+
+
+def _inherited_root() -> Path | None:
+    """Get CLAUDE_POWER_PACK_PROJECT_ROOT if the cwd is inside it."""
+    override = os.environ.get(PROJECT_ROOT_ENV)
+    if not override:
+        return None
+    root = Path(override)
+    try:
+        resolved = root.resolve()
+        cwd = Path(os.getcwd()).resolve()
+    except OSError:
+        return None
+    if cwd == resolved or resolved in cwd.parents:
+        return root
+    return None
+
 
 def get_project_root() -> Path:
     """Get the root directory of the git repository.
 
     For worktrees, this returns the main repository root (not the
     worktree directory), ensuring consistency across all worktrees.
+    The repository is found by reading ``.git`` from the filesystem,
+    falling back to ``git rev-parse`` for layouts that parser does not
+    handle. The result is cached per working directory, so repeated
+    calls in one process (e.g. the UI server) resolve it only once.
+    If ``CLAUDE_POWER_PACK_PROJECT_ROOT`` is set and the working
+    directory is inside it, it is used as-is.
 
     Returns:
         Path to the git repository root.
@@ -31,6 +61,61 @@ def get_project_root() -> Path:
     Raises:
         RuntimeError: If not inside a git repository.
     """
+    inherited = _inherited_root()
+    if inherited is not None:
+        return inherited
+    return _project_root_for(os.getcwd())
+
+
+# Environment variables that change how git discovers the repository;
+# when any is set, defer to git itself
+_GIT_DISCOVERY_ENV = (
+    "GIT_DIR",
+    "GIT_COMMON_DIR",
+    "GIT_WORK_TREE",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+)
+
+
+def _find_root_from_dotgit(cwd: str) -> Path | None:
+    """Find the main repository root by reading ``.git`` entries.
+
+    Handles plain repositories (a ``.git`` directory) and linked
+    worktrees (a ``.git`` file whose gitdir has a ``commondir``).
+    Returns None for anything else, e.g. submodules.
+    """
+    if any(name in os.environ for name in _GIT_DISCOVERY_ENV):
+        return None
+
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dotgit = directory / ".git"
+        if dotgit.is_dir():
+            return directory.resolve()
+        if not dotgit.is_file():
+            continue
+
+        try:
+            content = dotgit.read_text().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            gitdir = directory / content[len("gitdir:"):].strip()
+            commondir = (gitdir / "commondir").read_text().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return (gitdir / commondir).resolve().parent
+
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _project_root_for(cwd: str) -> Path:
+    """Resolve the git repository root for ``cwd`` (see get_project_root)."""
+    root = _find_root_from_dotgit(cwd)
+    if root is not None:
+        return root
+
     try:
         # git rev-parse --show-toplevel gives the worktree root
         # For the main repo root, we need --git-common-dir
@@ -39,6 +124,7 @@ def get_project_root() -> Path:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode != 0:
             raise RuntimeError("Not inside a git repository")
@@ -56,6 +142,7 @@ def get_project_root() -> Path:
                 capture_output=True,
                 text=True,
                 timeout=5,
+                cwd=cwd,
             )
             if toplevel.returncode != 0:
                 raise RuntimeError("Not inside a git repository")
@@ -73,11 +160,19 @@ def get_project_root() -> Path:
         raise RuntimeError("git command timed out")
 
 
+def _is_safe_name(name: str) -> bool:
+    """Check that a name can be used as a single path component."""
+    return bool(name) and name not in (".", "..") and all(c.isalnum() or c in "-_." for c in name)
+
+
 def get_project_id(project_root: Path | None = None) -> str:
     """Get a stable project identifier.
 
     Uses the repository directory name by default. Falls back to
     a hash of the absolute path if the name contains unusual characters.
+    Without an explicit root, a filesystem-safe ``CLAUDE_POWER_PACK_PROJECT_ID``
+    from the environment takes precedence over detection, provided the
+    working directory is inside ``CLAUDE_POWER_PACK_PROJECT_ROOT``.
 
     Args:
         project_root: Override the auto-detected project root.
@@ -86,12 +181,19 @@ def get_project_id(project_root: Path | None = None) -> str:
         A filesystem-safe project identifier string.
     """
     if project_root is None:
-        project_root = get_project_root()
+        inherited = _inherited_root()
+        if inherited is not None:
+            override = os.environ.get(PROJECT_ID_ENV, "")
+            if _is_safe_name(override):
+                return override
+            project_root = inherited
+        else:
+            project_root = _project_root_for(os.getcwd())
 
     name = project_root.name
 
     # Validate the name is filesystem-safe
-    if name and all(c.isalnum() or c in "-_." for c in name):
+    if _is_safe_name(name):
         return name.lower()
 
     # Fall back to a short hash of the full path
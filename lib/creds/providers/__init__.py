@@ -4,6 +4,10 @@ Available providers:
 - EnvSecretsProvider: Environment variables and .env files (legacy)
 - DotEnvSecretsProvider: Global config .env files with bundle support
 - AWSSecretsProvider: AWS Secrets Manager with bundle support (requires boto3)
+- AWSLiteSecretsProvider: Read-only AWS Secrets Manager access without boto3
+  (in providers.aws_lite; environment credentials only)
+- CachedBundleProvider: Persistent on-disk cache around another bundle
+  provider (in providers.cached; opt-in)
 
 Usage:
     from lib.creds.providers import DotEnvSecretsProvider
@@ -24,13 +28,25 @@ Usage:
         bundle = aws.get_bundle("my-project")
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .dotenv import DotEnvSecretsProvider
 from .env import EnvSecretsProvider
 
-# AWS provider is optional - boto3 may not be installed
-try:
+if TYPE_CHECKING:
     from .aws import AWSSecretsProvider
-except Exception:
-    AWSSecretsProvider = None  # type: ignore
 
 __all__ = ["EnvSecretsProvider", "AWSSecretsProvider", "DotEnvSecretsProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the AWS provider (and boto3) on first access only."""
+    if name == "AWSSecretsProvider":
+        # AWS provider is optional - boto3 may not be installed
+        try:
+            from .aws import AWSSecretsProvider as provider
+        except Exception:
+            provider = None  # type: ignore
+        globals()[name] = provider
+        return provider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
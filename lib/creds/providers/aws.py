@@ -19,12 +19,16 @@ Usage:
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
 import os
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, Literal, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Literal, Optional, Tuple
 
 from ..base import (
     BundleProvider,
@@ -34,20 +38,241 @@ from ..base import (
     SecretNotFoundError,
     SecretsError,
 )
+from .aws_lite import validate_secret_id
 
 logger = logging.getLogger(__name__)
 
-# Try to import boto3, but it's optional
-try:
-    import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
+# boto3 is optional and slow to import, so only check that it is installed
+# here; _load_boto3() imports it (and binds the botocore exceptions) when a
+# client is first needed
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
+boto3: Any = None
+ClientError: Any = Exception
+NoCredentialsError: Any = Exception
+
+
+def _load_boto3() -> Any:
+    """Import boto3 on first use and return the module."""
+    global boto3, ClientError, NoCredentialsError
+    if boto3 is None:
+        import boto3 as boto3_module
+        from botocore.exceptions import ClientError as client_error
+        from botocore.exceptions import NoCredentialsError as no_credentials_error
+
+        ClientError, NoCredentialsError = client_error, no_credentials_error
+        boto3 = boto3_module
+    return boto3
+
 
-    BOTO3_AVAILABLE = True
+# orjson is optional; it parses and serializes secret payloads faster
+try:
+    import orjson
 except ImportError:
-    BOTO3_AVAILABLE = False
-    boto3 = None  # type: ignore
-    ClientError = Exception  # type: ignore
-    NoCredentialsError = Exception  # type: ignore
+    orjson = None  # type: ignore
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a SecretString (orjson errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a secret payload compactly."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Environment variables that point boto3 at credentials
+_AWS_CREDENTIAL_ENV = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_ROLE_ARN",
+    "AWS_WEB_IDENTITY_TOKEN_FILE",
+    "AWS_CONTAINER_CREDENTIALS_RELATIVE_URI",
+    "AWS_CONTAINER_CREDENTIALS_FULL_URI",
+)
+
+# Files that identify an EC2 host, whose instance role boto3 would use:
+# (path, expected prefix)
+_EC2_MARKERS = (
+    ("/sys/devices/virtual/dmi/id/sys_vendor", "Amazon EC2"),
+    ("/sys/hypervisor/uuid", "ec2"),
+)
+
+
+def credentials_configured() -> bool:
+    """Check cheaply whether boto3 could find AWS credentials here.
+
+    Looks only at environment variables, the shared credentials/config
+    files and EC2 host markers; it imports nothing and opens no sockets.
+    A True result still needs is_available() to confirm.
+    """
+    if any(os.environ.get(name) for name in _AWS_CREDENTIAL_ENV):
+        return True
+
+    for env_name, default in (
+        ("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials"),
+        ("AWS_CONFIG_FILE", "~/.aws/config"),
+    ):
+        if os.path.isfile(os.path.expanduser(os.environ.get(env_name, default))):
+            return True
+
+    for path, prefix in _EC2_MARKERS:
+        try:
+            with open(path) as f:
+                if f.read(64).startswith(prefix):
+                    return True
+        except OSError:
+            continue
+
+    return False
+
+
+class _TTLCache:
+    """Thread-safe cache whose entries expire and whose size is bounded.
+
+    Each entry keeps the time it was stored; callers pass the TTL on
+    lookup, so providers with different TTLs can share one cache. When
+    full, the least recently used entry is evicted. One lock guards all
+    entries; load() makes concurrent misses on a key share one fetch.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, ttl: float) -> Any:
+        """Return the cached value, or None if missing or older than ttl."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[1] >= ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, timestamp: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.time() if timestamp is None else timestamp)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def load(self, key: Hashable, ttl: float, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, calling loader and caching its result on a miss.
+
+        If another thread is already loading the key, wait for its result
+        instead of calling loader again. Loader errors propagate to every
+        waiting caller and nothing is cached. A load that was in flight
+        when the key was invalidated returns its value but does not cache
+        it, since it may predate the write that caused the invalidation.
+        """
+        with self._lock:
+            value = self.get(key, ttl)
+            if value is not None:
+                return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            now = time.time()
+            value = loader()
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    self.set(key, value, now)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry and detach any load of it that is in flight."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and detach every in-flight load."""
+        with self._lock:
+            self._data.clear()
+            self._inflight.clear()
+
+
+# Shared by all provider instances, keyed by (region, role_arn, secret_id),
+# so re-creating a provider does not discard what was already fetched
+_SECRET_CACHE = _TTLCache()
+_BUNDLE_CACHE = _TTLCache()
+
+
+# boto3 clients shared by provider instances: {(region, role_arn): (client, expiration)}.
+# Clients for assumed roles carry the credentials' expiration; plain ones None.
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str]], Tuple[Any, Optional[datetime]]] = {}
+_STS_CLIENTS: Dict[Optional[str], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Re-assume a role this long before its credentials expire
+_CREDENTIAL_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _is_fresh(expiration: Optional[datetime]) -> bool:
+    """Check whether credentials expiring at ``expiration`` are still usable."""
+    return expiration is None or datetime.now(timezone.utc) < expiration - _CREDENTIAL_REFRESH_MARGIN
+
+
+def _shared_client(region: Optional[str], role_arn: Optional[str]) -> Tuple[Any, Optional[datetime]]:
+    """Get a Secrets Manager client for region/role, creating it once per process.
+
+    Clients for an assumed role are rebuilt shortly before the role's
+    credentials expire.
+    """
+    key = (region, role_arn)
+    _load_boto3()
+    with _CLIENT_LOCK:
+        cached = _CLIENT_CACHE.get(key)
+        if cached is not None and _is_fresh(cached[1]):
+            return cached
+
+        if role_arn:
+            sts = _STS_CLIENTS.get(region)
+            if sts is None:
+                sts = _STS_CLIENTS[region] = boto3.client("sts", region_name=region)
+            assumed = sts.assume_role(
+                RoleArn=role_arn,
+                RoleSessionName="cpp-secrets",
+            )
+            creds = assumed["Credentials"]
+            client = boto3.client(
+                "secretsmanager",
+                region_name=region,
+                aws_access_key_id=creds["AccessKeyId"],
+                aws_secret_access_key=creds["SecretAccessKey"],
+                aws_session_token=creds["SessionToken"],
+            )
+            entry: Tuple[Any, Optional[datetime]] = (client, creds.get("Expiration"))
+        else:
+            entry = (boto3.client("secretsmanager", region_name=region), None)
+
+        _CLIENT_CACHE[key] = entry
+        return entry
 
 
 class AWSSecretsProvider(BundleProvider):
@@ -55,7 +280,7 @@ class AWSSecretsProvider(BundleProvider):
 
     This provider:
     - Requires boto3 and valid AWS credentials
-    - Caches secrets to minimize API calls (with TTL)
+    - Caches secrets to minimize API calls (with TTL, shared across instances)
     - Supports both secret names and ARNs
     - Supports per-project IAM role assumption for isolation
 
@@ -68,6 +293,9 @@ class AWSSecretsProvider(BundleProvider):
     # Default cache TTL: 5 minutes (300 seconds)
     DEFAULT_CACHE_TTL = 300
 
+    # BatchGetSecretValue accepts at most 20 IDs per call
+    BATCH_SIZE = 20
+
     # Secret naming convention for bundle storage
     BUNDLE_PREFIX = "claude-power-pack"
 
@@ -91,36 +319,35 @@ class AWSSecretsProvider(BundleProvider):
         self._cache_ttl = cache_ttl
         self._role_arn = role_arn
         self._client: Any = None
+        self._client_expiration: Optional[datetime] = None
         self._available: Optional[bool] = None
-        # Time-based cache: {secret_id: (value, timestamp)}
-        self._cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
+    def _cache_key(self, secret_id: str) -> Tuple[Optional[str], Optional[str], str]:
+        """Key for the shared caches; credentials differ per region and role."""
+        return (self._region, self._role_arn, secret_id)
+
+    def cache_scope(self) -> tuple[str, ...]:
+        """Region, role, profile and access key the client is built from."""
+        return (
+            self._region or "",
+            self._role_arn or "",
+            os.environ.get("AWS_PROFILE", ""),
+            os.environ.get("AWS_ACCESS_KEY_ID", ""),
+        )
 
     def _get_client(self) -> Any:
-        """Get or create boto3 Secrets Manager client."""
+        """Get or create boto3 Secrets Manager client.
+
+        Clients (and assumed-role credentials) are shared by every
+        provider with the same region and role.
+        """
         if not BOTO3_AVAILABLE:
             raise ProviderNotAvailableError(
                 "boto3 is not installed. Install with: pip install boto3"
             )
 
-        if self._client is None:
-            if self._role_arn:
-                sts = boto3.client("sts", region_name=self._region)
-                assumed = sts.assume_role(
-                    RoleArn=self._role_arn,
-                    RoleSessionName="cpp-secrets",
-                )
-                creds = assumed["Credentials"]
-                self._client = boto3.client(
-                    "secretsmanager",
-                    region_name=self._region,
-                    aws_access_key_id=creds["AccessKeyId"],
-                    aws_secret_access_key=creds["SecretAccessKey"],
-                    aws_session_token=creds["SessionToken"],
-                )
-            else:
-                self._client = boto3.client(
-                    "secretsmanager", region_name=self._region
-                )
+        if self._client is None or not _is_fresh(self._client_expiration):
+            self._client, self._client_expiration = _shared_client(self._region, self._role_arn)
 
         return self._client
 
@@ -142,11 +369,13 @@ class AWSSecretsProvider(BundleProvider):
     def is_available(self) -> bool:
         """Check if AWS credentials are configured.
 
-        Performs a lightweight check by listing secrets (max 1 result).
-        Caches the result to avoid repeated API calls.
+        Resolves credentials locally rather than calling an API; the
+        first real request reports any authorization problem. With a
+        role to assume, building the client (an STS AssumeRole call)
+        is the check. Caches the result.
 
         Returns:
-            True if AWS credentials are valid and accessible.
+            True if AWS credentials can be resolved.
         """
         if self._available is not None:
             return self._available
@@ -157,23 +386,13 @@ class AWSSecretsProvider(BundleProvider):
             return False
 
         try:
-            client = self._get_client()
-            # Lightweight check - just verify credentials work
-            client.list_secrets(MaxResults=1)
-            self._available = True
-            logger.debug("AWS Secrets Manager available")
-        except NoCredentialsError:
-            self._available = False
-            logger.debug("No AWS credentials configured")
-        except ClientError as e:
-            # Access denied still means credentials are valid
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "AccessDeniedException":
+            if self._role_arn:
+                self._get_client()
                 self._available = True
-                logger.debug("AWS credentials valid (access denied for list)")
             else:
-                self._available = False
-                logger.debug(f"AWS error: {error_code}")
+                session = _load_boto3().session.Session(region_name=self._region)
+                self._available = session.get_credentials() is not None
+            logger.debug(f"AWS credentials {'found' if self._available else 'not configured'}")
         except Exception as e:
             self._available = False
             logger.debug(f"AWS check failed: {e}")
@@ -195,42 +414,120 @@ class AWSSecretsProvider(BundleProvider):
             SecretsError: For other retrieval failures.
             ValueError: If secret_id is invalid.
         """
-        # Input validation
-        if not secret_id or not isinstance(secret_id, str):
-            raise ValueError("secret_id must be a non-empty string")
-        if len(secret_id) > 512:
-            raise ValueError("secret_id too long (max 512 characters)")
-        # AWS secret names/ARNs: alphanumeric, hyphens, underscores, slashes, plus, equals, periods, at, colon
-        # ARNs start with "arn:" and have colons, so we need to allow those
-        if not secret_id.startswith("arn:"):
-            # For non-ARN names, be more restrictive
-            if not all(c.isalnum() or c in "-_/+.@" for c in secret_id):
-                raise ValueError(
-                    "secret_id must contain only alphanumeric characters, "
-                    "hyphens, underscores, slashes, plus, periods, or at-signs"
-                )
+        validate_secret_id(secret_id)
 
         if self._cache_enabled:
             return self._get_secret_cached(secret_id)
         return self._get_secret_uncached(secret_id)
 
+    def get_secrets(self, secret_ids: list[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several secrets with as few API calls as possible.
+
+        Cached secrets are served from the TTL cache; the rest are fetched
+        with BatchGetSecretValue, up to BATCH_SIZE per call. Duplicate IDs
+        are fetched once.
+
+        Args:
+            secret_ids: Secret names or ARNs.
+
+        Returns:
+            Dictionary mapping each requested ID to its secret fields.
+
+        Raises:
+            SecretNotFoundError: If any secret doesn't exist.
+            ProviderNotAvailableError: If AWS is not configured.
+            SecretsError: For other retrieval failures.
+            ValueError: If any secret_id is invalid.
+        """
+        ids = list(dict.fromkeys(secret_ids))
+        for secret_id in ids:
+            validate_secret_id(secret_id)
+
+        now = time.time()
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: list[str] = []
+        for secret_id in ids:
+            cached = None
+            if self._cache_enabled:
+                cached = _SECRET_CACHE.get(self._cache_key(secret_id), self._cache_ttl)
+            if cached is not None:
+                results[secret_id] = cached
+            else:
+                pending.append(secret_id)
+
+        if not pending:
+            return results
+
+        if not self.is_available():
+            raise ProviderNotAvailableError(
+                "AWS Secrets Manager is not available. "
+                "Ensure AWS credentials are configured."
+            )
+
+        client = self._get_client()
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            chunk = pending[start:start + self.BATCH_SIZE]
+            fetched = self._batch_get(client, chunk)
+            results.update(fetched)
+            if self._cache_enabled:
+                for secret_id, value in fetched.items():
+                    _SECRET_CACHE.set(self._cache_key(secret_id), value, now)
+
+        return results
+
+    def _batch_get(self, client: Any, secret_ids: list[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch up to BATCH_SIZE secrets with one BatchGetSecretValue call."""
+        try:
+            response = client.batch_get_secret_value(SecretIdList=secret_ids)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            raise SecretsError(f"AWS error retrieving secrets: {error_code}") from e
+
+        for error in response.get("Errors", []):
+            secret_id = error.get("SecretId", "")
+            error_code = error.get("ErrorCode", "Unknown")
+            if error_code == "ResourceNotFoundException":
+                raise SecretNotFoundError(
+                    f"Secret '{secret_id}' not found in AWS Secrets Manager"
+                )
+            raise SecretsError(
+                f"AWS error retrieving '{secret_id}': {error_code} - {error.get('Message', '')}"
+            )
+
+        # Entries carry both the name and the ARN; key them by whichever was asked for
+        wanted = set(secret_ids)
+        results: Dict[str, Dict[str, Any]] = {}
+        for entry in response.get("SecretValues", []):
+            secret_id = entry.get("Name") if entry.get("Name") in wanted else entry.get("ARN")
+            if secret_id not in wanted:
+                continue
+            try:
+                results[secret_id] = _json_loads(entry.get("SecretString", "{}"))
+            except json.JSONDecodeError as e:
+                raise SecretsError(
+                    f"Secret '{secret_id}' is not valid JSON. "
+                    "Secrets must be stored as JSON objects."
+                ) from e
+
+        missing = wanted.difference(results)
+        if missing:
+            raise SecretNotFoundError(
+                f"Secret '{sorted(missing)[0]}' not found in AWS Secrets Manager"
+            )
+        return results
+
     def _get_secret_cached(self, secret_id: str) -> Dict[str, Any]:
         """Cached version of secret retrieval with TTL."""
-        now = time.time()
+        key = self._cache_key(secret_id)
 
         # Check if cached and not expired
-        if secret_id in self._cache:
-            value, timestamp = self._cache[secret_id]
-            age = now - timestamp
-            if age < self._cache_ttl:
-                logger.debug(f"Cache hit for '{secret_id}' (age: {age:.1f}s)")
-                return value
-            else:
-                logger.debug(f"Cache expired for '{secret_id}' (age: {age:.1f}s)")
+        value = _SECRET_CACHE.get(key, self._cache_ttl)
+        if value is not None:
+            logger.debug(f"Cache hit for '{secret_id}'")
+            return value
 
-        # Fetch and cache
-        value = self._get_secret_uncached(secret_id)
-        self._cache[secret_id] = (value, now)
+        # Fetch and cache (once, however many threads missed together)
+        value = _SECRET_CACHE.load(key, self._cache_ttl, lambda: self._get_secret_uncached(secret_id))
         logger.debug(f"Cached secret '{secret_id}' (TTL: {self._cache_ttl}s)")
         return value
 
@@ -248,7 +545,7 @@ class AWSSecretsProvider(BundleProvider):
 
             # Parse the secret string (expected to be JSON)
             secret_string = response.get("SecretString", "{}")
-            return json.loads(secret_string)
+            return _json_loads(secret_string)
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -287,11 +584,24 @@ class AWSSecretsProvider(BundleProvider):
     def clear_cache(self) -> None:
         """Clear the secrets cache.
 
-        Call this after rotating secrets to ensure fresh values.
+        The cache is shared, so this clears entries fetched by every
+        provider instance. Call this after rotating secrets to ensure
+        fresh values.
         """
-        self._cache.clear()
+        _SECRET_CACHE.clear()
+        _BUNDLE_CACHE.clear()
         logger.info("AWS secrets cache cleared")
 
+    def invalidate(self, secret_id: str) -> None:
+        """Drop one secret from the cache so the next read refetches it.
+
+        Args:
+            secret_id: The secret name or ARN.
+        """
+        key = self._cache_key(secret_id)
+        _SECRET_CACHE.invalidate(key)
+        _BUNDLE_CACHE.invalidate(key)
+
     def get_database_secret(
         self,
         secret_id: str,
@@ -342,7 +652,125 @@ class AWSSecretsProvider(BundleProvider):
     def get_bundle(
         self, project_id: str, version: str | None = None
     ) -> SecretBundle:
-        """Get all secrets for a project as a bundle."""
+        """Get all secrets for a project as a bundle.
+
+        The latest version is served from the TTL cache when caching is
+        enabled; explicit versions are always fetched.
+        """
+        if not self._cache_enabled or version:
+            return self._fetch_bundle(project_id, version)
+
+        secret_name = self._bundle_secret_name(project_id)
+        key = self._cache_key(secret_name)
+        cached = _BUNDLE_CACHE.get(key, self._cache_ttl)
+        if cached is not None:
+            logger.debug(f"Cache hit for bundle '{secret_name}'")
+        else:
+            def fetch() -> Tuple[Dict[str, str], Optional[str]]:
+                bundle = self._fetch_bundle(project_id)
+                return dict(bundle.secrets), bundle.version
+
+            cached = _BUNDLE_CACHE.load(key, self._cache_ttl, fetch)
+
+        secrets, version_id = cached
+        return SecretBundle(
+            project_id=project_id,
+            secrets=dict(secrets),
+            version=version_id,
+            updated_at=datetime.now(timezone.utc),
+            provider=self.name,
+        )
+
+    def get_bundles(self, project_ids: list[str]) -> Dict[str, SecretBundle]:
+        """Get the latest bundles for several projects.
+
+        Cached bundles are served from the TTL cache; the rest are fetched
+        with BatchGetSecretValue, up to BATCH_SIZE per call. Projects
+        without a bundle secret get an empty bundle, as in get_bundle.
+
+        Raises:
+            ProviderNotAvailableError: If AWS is not configured.
+            SecretsError: For retrieval failures or a malformed bundle.
+        """
+        ids = list(dict.fromkeys(project_ids))
+        now = time.time()
+        entries: Dict[str, Tuple[Dict[str, str], Optional[str]]] = {}
+        pending: list[str] = []
+        for project_id in ids:
+            cached = None
+            if self._cache_enabled:
+                cached = _BUNDLE_CACHE.get(
+                    self._cache_key(self._bundle_secret_name(project_id)), self._cache_ttl
+                )
+            if cached is not None:
+                entries[project_id] = cached
+            else:
+                pending.append(project_id)
+
+        if pending:
+            if not self.is_available():
+                raise ProviderNotAvailableError(
+                    "AWS Secrets Manager is not available. "
+                    "Ensure AWS credentials are configured."
+                )
+
+            client = self._get_client()
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                fetched = self._batch_get_bundles(client, pending[start:start + self.BATCH_SIZE])
+                entries.update(fetched)
+                if self._cache_enabled:
+                    for project_id, entry in fetched.items():
+                        key = self._cache_key(self._bundle_secret_name(project_id))
+                        _BUNDLE_CACHE.set(key, entry, now)
+
+        return {
+            project_id: SecretBundle(
+                project_id=project_id,
+                secrets=dict(entries[project_id][0]),
+                version=entries[project_id][1],
+                updated_at=datetime.now(timezone.utc),
+                provider=self.name,
+            )
+            for project_id in ids
+        }
+
+    def _batch_get_bundles(
+        self, client: Any, project_ids: list[str]
+    ) -> Dict[str, Tuple[Dict[str, str], Optional[str]]]:
+        """Fetch up to BATCH_SIZE bundles with one BatchGetSecretValue call."""
+        names = {self._bundle_secret_name(project_id): project_id for project_id in project_ids}
+        try:
+            response = client.batch_get_secret_value(SecretIdList=list(names))
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            raise SecretsError(f"AWS error: {error_code}") from e
+
+        for error in response.get("Errors", []):
+            error_code = error.get("ErrorCode", "Unknown")
+            if error_code != "ResourceNotFoundException":
+                raise SecretsError(f"AWS error: {error_code}")
+
+        # Missing bundle secrets read as empty bundles
+        results: Dict[str, Tuple[Dict[str, str], Optional[str]]] = {
+            project_id: ({}, None) for project_id in project_ids
+        }
+        for entry in response.get("SecretValues", []):
+            project_id = names.get(entry.get("Name", ""))
+            if project_id is None:
+                continue
+            try:
+                secrets = _json_loads(entry.get("SecretString", "{}"))
+            except json.JSONDecodeError as e:
+                raise SecretsError(
+                    f"Bundle for project '{project_id}' is not valid JSON"
+                ) from e
+            results[project_id] = (secrets, entry.get("VersionId"))
+        return results
+
+    def _fetch_bundle(
+        self, project_id: str, version: str | None = None
+    ) -> SecretBundle:
+        """Get a project bundle from AWS, bypassing the cache."""
         secret_name = self._bundle_secret_name(project_id)
 
         try:
@@ -352,7 +780,7 @@ class AWSSecretsProvider(BundleProvider):
 
             client = self._get_client()
             response = client.get_secret_value(**kwargs)
-            secrets = json.loads(response.get("SecretString", "{}"))
+            secrets = _json_loads(response.get("SecretString", "{}"))
 
             return SecretBundle(
                 project_id=project_id,
@@ -377,18 +805,26 @@ class AWSSecretsProvider(BundleProvider):
         bundle: SecretBundle,
         mode: Literal["merge", "replace"] = "merge",
     ) -> SecretBundle:
-        """Write secrets for a project to AWS Secrets Manager."""
+        """Write secrets for a project to AWS Secrets Manager.
+
+        A merge that changes nothing skips the write (and the new
+        secret version it would create).
+        """
         secret_name = self._bundle_secret_name(bundle.project_id)
         client = self._get_client()
 
         if mode == "merge":
-            existing = self.get_bundle(bundle.project_id)
+            # Merge against the live secret, never a cached copy
+            existing = self._fetch_bundle(bundle.project_id)
             merged = dict(existing.secrets)
             merged.update(bundle.secrets)
+            if existing.version is not None and merged == existing.secrets:
+                logger.debug(f"No changes for '{secret_name}', skipping write")
+                return existing
         else:
             merged = dict(bundle.secrets)
 
-        secret_string = json.dumps(merged)
+        secret_string = _json_dumps(merged)
 
         try:
             response = client.put_secret_value(
@@ -407,7 +843,7 @@ class AWSSecretsProvider(BundleProvider):
                 raise SecretsError(f"AWS error writing secrets: {error_code}") from e
 
         # Clear cache for this secret
-        self._cache.pop(secret_name, None)
+        self.invalidate(secret_name)
 
         return SecretBundle(
             project_id=bundle.project_id,
@@ -419,13 +855,12 @@ class AWSSecretsProvider(BundleProvider):
 
     def delete_key(self, project_id: str, key: str) -> None:
         """Delete a single key from the project bundle."""
-        bundle = self.get_bundle(project_id)
-        if key not in bundle.secrets:
+        bundle = self._fetch_bundle(project_id)
+        if not bundle.delete(key):
             raise SecretNotFoundError(
                 f"Key '{key}' not found in project '{project_id}'"
             )
 
-        del bundle.secrets[key]
         self.put_bundle(bundle, mode="replace")
 
     def list_keys(self, project_id: str) -> list[str]:
@@ -470,7 +905,14 @@ class AWSSecretsProvider(BundleProvider):
                         "secretsmanager:ListSecretVersionIds",
                     ],
                     "Resource": secret_arn_pattern,
-                }
+                },
+                {
+                    # BatchGetSecretValue has no resource-level scoping;
+                    # each secret it returns still needs GetSecretValue above
+                    "Effect": "Allow",
+                    "Action": "secretsmanager:BatchGetSecretValue",
+                    "Resource": "*",
+                },
             ],
         }
 
@@ -0,0 +1,285 @@
+"""Read-only AWS Secrets Manager provider without boto3.
+
+Calls the Secrets Manager JSON API directly over HTTPS, signing requests
+with AWS Signature Version 4. Importing boto3/botocore dominates the
+start-up time of short-lived commands such as ``creds run``, so read-only
+paths can use this provider when static credentials are available.
+
+Only credentials from the environment (AWS_ACCESS_KEY_ID,
+AWS_SECRET_ACCESS_KEY, optional AWS_SESSION_TOKEN) are supported; they
+take precedence in boto3's credential chain too, so both providers read
+the same secret. Anything else (profiles, SSO, instance roles, role
+assumption, writes) needs AWSSecretsProvider.
+
+Usage:
+    from lib.creds.providers.aws_lite import AWSLiteSecretsProvider
+
+    provider = AWSLiteSecretsProvider()
+    if provider.is_available():
+        bundle = provider.get_bundle("my-project")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import re
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from typing import Any, Dict, Literal, Mapping, NamedTuple, Optional
+
+from ..base import (
+    BundleProvider,
+    ProviderCaps,
+    ProviderNotAvailableError,
+    SecretBundle,
+    SecretNotFoundError,
+    SecretsError,
+)
+
+_SERVICE = "secretsmanager"
+_ALGORITHM = "AWS4-HMAC-SHA256"
+
+
+class Credentials(NamedTuple):
+    """Static AWS credentials."""
+
+    access_key: str
+    secret_key: str
+    token: Optional[str] = None
+
+
+def credentials_from_env() -> Optional[Credentials]:
+    """Read static AWS credentials from the environment, if present."""
+    access_key = os.environ.get("AWS_ACCESS_KEY_ID")
+    secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
+    if not access_key or not secret_key:
+        return None
+    return Credentials(access_key, secret_key, os.environ.get("AWS_SESSION_TOKEN") or None)
+
+
+# Secret names: the characters Secrets Manager allows in a name
+_SECRET_ID_RE = re.compile(r"[A-Za-z0-9/_+=.@-]+")
+# Secret ARNs, in any partition
+_ARN_RE = re.compile(r"arn:aws[a-z-]*:secretsmanager:")
+
+
+def validate_secret_id(secret_id: str) -> None:
+    """Reject secret IDs that are not valid AWS secret names or ARNs."""
+    if not secret_id or not isinstance(secret_id, str):
+        raise ValueError("secret_id must be a non-empty string")
+    if len(secret_id) > 512:
+        raise ValueError("secret_id too long (max 512 characters)")
+    if not _ARN_RE.match(secret_id) and not _SECRET_ID_RE.fullmatch(secret_id):
+        raise ValueError(
+            "secret_id must be a secret ARN or contain only ASCII letters, digits, "
+            "hyphens, underscores, slashes, plus, equals, periods, or at-signs"
+        )
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+def sign_v4(
+    method: str,
+    host: str,
+    region: str,
+    service: str,
+    headers: Mapping[str, str],
+    body: bytes,
+    credentials: Credentials,
+    amz_date: str,
+) -> Dict[str, str]:
+    """Sign a request to ``https://{host}/`` with AWS Signature Version 4.
+
+    Args:
+        method: HTTP method.
+        host: Request host.
+        region: AWS region.
+        service: AWS service name used in the credential scope.
+        headers: Headers to sign, in addition to host and x-amz-date.
+        body: Request payload.
+        credentials: The credentials to sign with.
+        amz_date: Request time as ``YYYYMMDDTHHMMSSZ``.
+
+    Returns:
+        The headers to send, including Authorization.
+    """
+    signed = {k.lower(): v.strip() for k, v in headers.items()}
+    signed["host"] = host
+    signed["x-amz-date"] = amz_date
+    if credentials.token:
+        signed["x-amz-security-token"] = credentials.token
+
+    names = sorted(signed)
+    signed_headers = ";".join(names)
+    canonical_request = "\n".join([
+        method,
+        "/",
+        "",
+        "".join(f"{name}:{signed[name]}\n" for name in names),
+        signed_headers,
+        hashlib.sha256(body).hexdigest(),
+    ])
+
+    date = amz_date[:8]
+    scope = f"{date}/{region}/{service}/aws4_request"
+    string_to_sign = "\n".join([
+        _ALGORITHM,
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+
+    key = _hmac_sha256(f"AWS4{credentials.secret_key}".encode(), date)
+    for part in (region, service, "aws4_request"):
+        key = _hmac_sha256(key, part)
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    signed["authorization"] = (
+        f"{_ALGORITHM} Credential={credentials.access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    return signed
+
+
+class AWSLiteSecretsProvider(BundleProvider):
+    """Read-only AWS Secrets Manager provider using signed HTTPS calls.
+
+    Reads the same bundle secrets as AWSSecretsProvider but neither
+    caches nor writes; use AWSSecretsProvider for those.
+    """
+
+    # Must match AWSSecretsProvider.BUNDLE_PREFIX
+    BUNDLE_PREFIX = "claude-power-pack"
+
+    def __init__(self, region: Optional[str] = None, timeout: float = 10.0) -> None:
+        """Initialize the provider.
+
+        Args:
+            region: AWS region (default: from AWS_DEFAULT_REGION or us-east-1)
+            timeout: Socket timeout for each request, in seconds.
+        """
+        self._region = region or os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+        self._timeout = timeout
+        self._credentials = credentials_from_env()
+
+    def caps(self) -> ProviderCaps:
+        return ProviderCaps(can_read=True, can_list=True, supports_versions=True)
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "aws-secrets-manager"
+
+    def is_available(self) -> bool:
+        """Check whether static AWS credentials are set in the environment."""
+        return self._credentials is not None
+
+    def cache_scope(self) -> tuple[str, ...]:
+        """Region and access key the requests are signed with."""
+        access_key = self._credentials.access_key if self._credentials else ""
+        return (self._region or "", access_key)
+
+    def _call(self, target: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke one Secrets Manager API action and return its JSON reply."""
+        if self._credentials is None:
+            raise ProviderNotAvailableError(
+                "AWS credentials are not set in the environment"
+            )
+
+        host = f"{_SERVICE}.{self._region}.amazonaws.com"
+        body = json.dumps(payload).encode()
+        headers = sign_v4(
+            "POST",
+            host,
+            self._region,
+            _SERVICE,
+            {
+                "Content-Type": "application/x-amz-json-1.1",
+                "X-Amz-Target": f"secretsmanager.{target}",
+            },
+            body,
+            self._credentials,
+            time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()),
+        )
+        request = urllib.request.Request(f"https://{host}/", data=body, headers=headers, method="POST")
+
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                return json.loads(response.read() or b"{}")
+        except urllib.error.HTTPError as e:
+            try:
+                error = json.loads(e.read() or b"{}")
+            except ValueError:
+                error = {}
+            # "__type" may be namespaced, e.g. "com.amazonaws...#ResourceNotFoundException"
+            code = str(error.get("__type", f"HTTP {e.code}")).rpartition("#")[2]
+            message = error.get("message") or error.get("Message") or ""
+            if code == "ResourceNotFoundException":
+                raise SecretNotFoundError(message or "Secret not found") from e
+            raise SecretsError(f"AWS error: {code} - {message}") from e
+        except (urllib.error.URLError, OSError) as e:
+            raise SecretsError(f"AWS request failed: {e}") from e
+
+    def get_secret(self, secret_id: str) -> Dict[str, Any]:
+        """Retrieve a JSON secret by name or ARN.
+
+        Raises:
+            SecretNotFoundError: If secret doesn't exist.
+            ProviderNotAvailableError: If no credentials are set.
+            SecretsError: For other retrieval failures.
+            ValueError: If secret_id is invalid.
+        """
+        validate_secret_id(secret_id)
+        response = self._call("GetSecretValue", {"SecretId": secret_id})
+        try:
+            return json.loads(response.get("SecretString", "{}"))
+        except json.JSONDecodeError as e:
+            raise SecretsError(
+                f"Secret '{secret_id}' is not valid JSON. "
+                "Secrets must be stored as JSON objects."
+            ) from e
+
+    # --- Bundle interface ---
+
+    def get_bundle(
+        self, project_id: str, version: str | None = None
+    ) -> SecretBundle:
+        """Get all secrets for a project as a bundle."""
+        payload: Dict[str, Any] = {"SecretId": f"{self.BUNDLE_PREFIX}/{project_id}"}
+        if version:
+            payload["VersionId"] = version
+
+        try:
+            response = self._call("GetSecretValue", payload)
+        except SecretNotFoundError:
+            return SecretBundle(project_id=project_id, secrets={}, provider=self.name)
+
+        return SecretBundle(
+            project_id=project_id,
+            secrets=json.loads(response.get("SecretString", "{}")),
+            version=response.get("VersionId"),
+            updated_at=datetime.now(timezone.utc),
+            provider=self.name,
+        )
+
+    def put_bundle(
+        self,
+        bundle: SecretBundle,
+        mode: Literal["merge", "replace"] = "merge",
+    ) -> SecretBundle:
+        raise SecretsError("AWSLiteSecretsProvider is read-only; use AWSSecretsProvider")
+
+    def delete_key(self, project_id: str, key: str) -> None:
+        raise SecretsError("AWSLiteSecretsProvider is read-only; use AWSSecretsProvider")
+
+    def list_keys(self, project_id: str) -> list[str]:
+        """List all secret key names for a project."""
+        return sorted(self.get_bundle(project_id).secrets)
+
@@ -0,0 +1,200 @@
+"""Persistent bundle cache for remote providers.
+
+Every ``creds run`` is a fresh process, so in-memory caches never reach
+the next invocation and each run pays an AWS round trip.
+CachedBundleProvider wraps another bundle provider and keeps the last
+bundle it fetched under ~/.cache/claude-power-pack/bundles/, serving it
+until it is older than the TTL.
+
+Entries are keyed by the wrapped provider's cache_scope() (region, role,
+profile, access key) as well as the project ID, so switching AWS
+credentials or region never serves another account's bundle.
+
+Cached files hold secret values as plain JSON with the same protection
+as the dotenv store: owner-only (600) files in an owner-only (700)
+directory. Caching is therefore opt-in; set
+CLAUDE_POWER_PACK_BUNDLE_CACHE_TTL to a number of seconds (at most
+MAX_BUNDLE_CACHE_TTL) to enable it for ``creds run``. Writes made
+through the wrapper drop the cached bundle; writes made elsewhere show
+up once the TTL expires.
+
+Usage:
+    from lib.creds.providers.aws import AWSSecretsProvider
+    from lib.creds.providers.cached import CachedBundleProvider
+
+    provider = CachedBundleProvider(AWSSecretsProvider(), ttl=60)
+    bundle = provider.get_bundle("my-project")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Literal
+
+from ..base import BundleProvider, ProviderCaps, SecretBundle
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_CACHE_TTL_ENV = "CLAUDE_POWER_PACK_BUNDLE_CACHE_TTL"
+
+# Plaintext copies of secrets should not outlive a short working session
+MAX_BUNDLE_CACHE_TTL = 300.0
+
+
+def bundle_cache_ttl() -> float:
+    """Get the persistent cache TTL in seconds (0 when disabled)."""
+    try:
+        ttl = float(os.environ.get(BUNDLE_CACHE_TTL_ENV, "0"))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {BUNDLE_CACHE_TTL_ENV}")
+        return 0.0
+    if ttl > MAX_BUNDLE_CACHE_TTL:
+        logger.warning(f"{BUNDLE_CACHE_TTL_ENV} capped at {MAX_BUNDLE_CACHE_TTL:g} seconds")
+        return MAX_BUNDLE_CACHE_TTL
+    return ttl if ttl > 0 else 0.0
+
+
+def _default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return Path(cache_home) / "claude-power-pack" / "bundles"
+
+
+class CachedBundleProvider(BundleProvider):
+    """Bundle provider wrapper that persists bundles between processes."""
+
+    def __init__(
+        self,
+        provider: BundleProvider,
+        ttl: float,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Wrap a provider.
+
+        Args:
+            provider: The provider to read through to.
+            ttl: Seconds a cached bundle stays valid.
+            cache_dir: Override the cache directory.
+        """
+        self._provider = provider
+        self._ttl = ttl
+        self._cache_dir = cache_dir or _default_cache_dir()
+
+    @property
+    def name(self) -> str:
+        return self._provider.name
+
+    def caps(self) -> ProviderCaps:
+        return self._provider.caps()
+
+    def is_available(self) -> bool:
+        return self._provider.is_available()
+
+    def get_secret(self, secret_id: str) -> Dict[str, Any]:
+        return self._provider.get_secret(secret_id)
+
+    def cache_scope(self) -> tuple[str, ...]:
+        return self._provider.cache_scope()
+
+    def _path(self, project_id: str, scope: tuple[str, ...]) -> Path:
+        # Hash the identity so arbitrary project IDs stay one safe file name
+        identity = "\0".join((self.name, *scope, project_id))
+        digest = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        return self._cache_dir / f"{digest}.json"
+
+    def _read(self, project_id: str) -> SecretBundle | None:
+        scope = self.cache_scope()
+        path = self._path(project_id, scope)
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime >= self._ttl:
+                return None
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if (
+            data.get("provider") != self.name
+            or data.get("project_id") != project_id
+            or data.get("scope") != list(scope)
+        ):
+            return None
+        return SecretBundle(
+            project_id=project_id,
+            secrets=data.get("secrets", {}),
+            version=data.get("version"),
+            updated_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            provider=self.name,
+        )
+
+    def _write(self, bundle: SecretBundle) -> None:
+        scope = self.cache_scope()
+        payload = json.dumps({
+            "provider": self.name,
+            "scope": list(scope),
+            "project_id": bundle.project_id,
+            "version": bundle.version,
+            "secrets": bundle.secrets,
+        }).encode()
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir.chmod(0o700)
+            # mkstemp creates the file owner read/write only
+            fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_name, self._path(bundle.project_id, scope))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            # The cache is an optimization; never fail the read over it
+            logger.debug(f"Bundle cache write failed: {e}")
+
+    def invalidate(self, project_id: str) -> None:
+        """Drop the cached bundle for a project."""
+        with contextlib.suppress(FileNotFoundError):
+            self._path(project_id, self.cache_scope()).unlink()
+
+    def get_bundle(
+        self, project_id: str, version: str | None = None
+    ) -> SecretBundle:
+        """Get a bundle, from the persistent cache while it is fresh.
+
+        Explicit versions are always fetched from the wrapped provider.
+        """
+        if version:
+            return self._provider.get_bundle(project_id, version)
+
+        cached = self._read(project_id)
+        if cached is not None:
+            logger.debug(f"Persistent cache hit for bundle '{project_id}'")
+            return cached
+
+        bundle = self._provider.get_bundle(project_id)
+        self._write(bundle)
+        return bundle
+
+    def put_bundle(
+        self,
+        bundle: SecretBundle,
+        mode: Literal["merge", "replace"] = "merge",
+    ) -> SecretBundle:
+        self.invalidate(bundle.project_id)
+        return self._provider.put_bundle(bundle, mode)
+
+    def delete_key(self, project_id: str, key: str) -> None:
+        self.invalidate(project_id)
+        self._provider.delete_key(project_id, key)
+
+    def list_keys(self, project_id: str) -> list[str]:
+        return sorted(self.get_bundle(project_id).secrets)
@@ -15,8 +15,11 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import logging
-import shlex
+import os
+import re
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Literal
@@ -73,6 +76,27 @@ def _parse_env_file(path: Path) -> dict[str, str]:
     return result
 
 
+# Values containing whitespace or shell-special characters get quoted
+_NEEDS_QUOTE_RE = re.compile(r"[\s#\"'\\$]")
+
+# Parsed files keyed by path, reused while (inode, mtime_ns, size) is
+# unchanged; the inode catches atomic replaces landing in the same tick
+_PARSE_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, str]]] = {}
+
+
+def _parse_env_file_cached(path: Path, stat: os.stat_result) -> dict[str, str]:
+    """Parse a .env file, reusing the last result while the file is unchanged.
+
+    Returns a new dict on every call, so callers may modify it.
+    """
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _PARSE_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_env_file(path))
+        _PARSE_CACHE[path] = cached
+    return dict(cached[1])
+
+
 def _write_env_file(path: Path, secrets: dict[str, str]) -> None:
     """Write secrets to a .env file with proper formatting."""
     lines = [
@@ -86,17 +110,39 @@ def _write_env_file(path: Path, secrets: dict[str, str]) -> None:
 
     for key in sorted(secrets):
         value = secrets[key]
-        # Quote values that contain spaces, special chars, or are empty
-        if not value or " " in value or any(c in value for c in '#"\'\\$'):
-            value = shlex.quote(value)
+        # Quote values that contain whitespace, special chars, or are empty.
+        # Every such value is one shlex.quote would quote too, so build
+        # its output directly instead of letting it scan the value again.
+        if not value or _NEEDS_QUOTE_RE.search(value):
+            value = "'" + value.replace("'", "'\"'\"'") + "'"
         lines.append(f"{key}={value}")
 
     lines.append("")  # trailing newline
 
-    path.write_text("\n".join(lines))
-
-    # Enforce file permissions: owner read/write only
-    path.chmod(0o600)
+    _PARSE_CACHE.pop(path, None)
+
+    # Write a temp file (mkstemp creates it owner read/write only), flush
+    # it to disk, then rename it over the old file, so a crash never
+    # leaves a truncated secrets file behind
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write("\n".join(lines).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+    # Persist the rename itself; not every platform can fsync a directory
+    with contextlib.suppress(OSError):
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 class DotEnvSecretsProvider(BundleProvider):
@@ -160,7 +206,10 @@ class DotEnvSecretsProvider(BundleProvider):
     def get_bundle(
         self, project_id: str, version: str | None = None
     ) -> SecretBundle:
-        """Get all secrets for a project."""
+        """Get all secrets for a project.
+
+        The parsed file is cached until its mtime or size changes.
+        """
         path = self._get_env_path(project_id)
 
         if not path.exists():
@@ -180,7 +229,7 @@ class DotEnvSecretsProvider(BundleProvider):
             )
             path.chmod(0o600)
 
-        secrets = _parse_env_file(path)
+        secrets = _parse_env_file_cached(path, stat)
 
         return SecretBundle(
             project_id=project_id,
@@ -196,13 +245,22 @@ class DotEnvSecretsProvider(BundleProvider):
         bundle: SecretBundle,
         mode: Literal["merge", "replace"] = "merge",
     ) -> SecretBundle:
-        """Write secrets for a project."""
+        """Write secrets for a project.
+
+        A merge that changes nothing leaves the file untouched.
+        """
         path = self._get_env_path(bundle.project_id)
 
         if mode == "merge" and path.exists():
             existing = _parse_env_file(path)
-            existing.update(bundle.secrets)
-            merged = existing
+            merged = {**existing, **bundle.secrets}
+            if merged == existing:
+                return SecretBundle(
+                    project_id=bundle.project_id,
+                    secrets=merged,
+                    updated_at=datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc),
+                    provider=self.name,
+                )
         else:
             merged = dict(bundle.secrets)
 
@@ -233,8 +291,9 @@ class DotEnvSecretsProvider(BundleProvider):
         """List all secret key names for a project."""
         path = self._get_env_path(project_id)
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return []
 
-        secrets = _parse_env_file(path)
-        return sorted(secrets.keys())
+        return sorted(_parse_env_file_cached(path, stat))
@@ -38,6 +38,27 @@ except ImportError:
     dotenv_values = None  # type: ignore
 
 
+def _env_prefix(secret_id: str) -> str:
+    """Validate a secret_id and return its environment variable prefix.
+
+    Raises:
+        ValueError: If secret_id is invalid.
+    """
+    # Input validation
+    if not secret_id or not isinstance(secret_id, str):
+        raise ValueError("secret_id must be a non-empty string")
+    if len(secret_id) > 100:
+        raise ValueError("secret_id too long (max 100 characters)")
+    # Only allow alphanumeric, hyphens, and underscores
+    if not re.match(r'^[A-Za-z0-9_-]+$', secret_id):
+        raise ValueError(
+            "secret_id must contain only alphanumeric characters, "
+            "hyphens, and underscores"
+        )
+
+    return secret_id.upper().replace("-", "_")
+
+
 class EnvSecretsProvider(SecretsProvider):
     """Secrets provider using environment variables and .env files.
 
@@ -123,19 +144,7 @@ class EnvSecretsProvider(SecretsProvider):
             SecretNotFoundError: If no variables with this prefix exist.
             ValueError: If secret_id is invalid.
         """
-        # Input validation
-        if not secret_id or not isinstance(secret_id, str):
-            raise ValueError("secret_id must be a non-empty string")
-        if len(secret_id) > 100:
-            raise ValueError("secret_id too long (max 100 characters)")
-        # Only allow alphanumeric, hyphens, and underscores
-        if not re.match(r'^[A-Za-z0-9_-]+$', secret_id):
-            raise ValueError(
-                "secret_id must contain only alphanumeric characters, "
-                "hyphens, and underscores"
-            )
-
-        prefix = secret_id.upper().replace("-", "_")
+        prefix = _env_prefix(secret_id)
         result: Dict[str, Any] = {}
 
         # Gather all env vars with this prefix
@@ -168,6 +177,28 @@ class EnvSecretsProvider(SecretsProvider):
         logger.debug(f"Found {len(result)} fields for secret '{secret_id}'")
         return result
 
+    def get_secret_value(self, secret_id: str, field: str) -> Optional[str]:
+        """Get a single field, reading its variable directly when set.
+
+        get_secret() lowercases field names, so a lowercase field maps to
+        exactly one PREFIX_FIELD variable. If that variable is not in the
+        environment, falls back to the full prefix scan (which also reads
+        .env files and raises SecretNotFoundError for an unknown prefix).
+
+        Args:
+            secret_id: The prefix for environment variables.
+            field: The field name (e.g. "host" for DB_HOST).
+
+        Returns:
+            The field value, or None if field doesn't exist.
+        """
+        prefix = _env_prefix(secret_id)
+        if field.isascii() and field == field.lower():
+            value = os.environ.get(f"{prefix}_{field.upper()}")
+            if value is not None:
+                return value
+        return super().get_secret_value(secret_id, field)
+
     def get_database_secret(self, secret_id: str = "DB") -> Dict[str, Any]:
         """Convenience method for database credentials.
 
@@ -22,28 +22,52 @@ import os
 import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+from .audit import flush as flush_audit
 from .audit import log_action
-from .project import get_project_id
+from .project import PROJECT_ID_ENV, PROJECT_ROOT_ENV, get_project_id, get_project_root
+from .providers.cached import CachedBundleProvider, bundle_cache_ttl
 
 logger = logging.getLogger(__name__)
 
 
 def _get_bundle_provider(provider_name: str | None = None):
     """Get a bundle-capable provider."""
-    from .providers.aws import AWSSecretsProvider
-    from .providers.dotenv import DotEnvSecretsProvider
-
     if provider_name == "aws":
+        # Injection only reads, so skip importing boto3 when the
+        # environment already holds credentials
+        from .providers.aws_lite import AWSLiteSecretsProvider, credentials_from_env
+
+        if credentials_from_env() is not None:
+            return AWSLiteSecretsProvider()
+
+        from .providers.aws import AWSSecretsProvider
+
         return AWSSecretsProvider()
     elif provider_name == "dotenv":
+        from .providers.dotenv import DotEnvSecretsProvider
+
         return DotEnvSecretsProvider()
     else:
-        # Auto-detect: try AWS first, fall back to dotenv
-        aws = AWSSecretsProvider()
-        if aws.is_available():
-            return aws
-        return DotEnvSecretsProvider()
+        # Auto-detect: try AWS first, fall back to dotenv (cached per process)
+        from . import get_bundle_provider
+
+        return get_bundle_provider()
+
+
+def _resolve_project(project_id: str | None) -> tuple[str, Path | None]:
+    """Resolve the project ID and, when inside a repository, its root."""
+    try:
+        root: Path | None = get_project_root()
+    except RuntimeError:
+        if project_id is None:
+            raise
+        root = None
+    if project_id is None:
+        project_id = get_project_id()
+    return project_id, root
 
 
 def run_with_secrets(
@@ -51,6 +75,7 @@ def run_with_secrets(
     project_id: str | None = None,
     provider_name: str | None = None,
     extra_env: dict[str, str] | None = None,
+    exec_replace: bool = False,
 ) -> int:
     """Execute a command with secrets injected as environment variables.
 
@@ -63,6 +88,10 @@ def run_with_secrets(
         project_id: Override auto-detected project ID.
         provider_name: Force a specific provider ("aws", "dotenv").
         extra_env: Additional environment variables to set.
+        exec_replace: Replace the current process with the command
+            (POSIX only) instead of running it as a child. For CLI use,
+            where nothing happens after the command exits; on success
+            this function does not return.
 
     Returns:
         The subprocess exit code.
@@ -70,21 +99,36 @@ def run_with_secrets(
     if not command:
         raise ValueError("command must not be empty")
 
-    if project_id is None:
-        project_id = get_project_id()
+    # Resolve the project (git subprocesses) while provider selection
+    # probes AWS, instead of waiting on one and then the other
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        project_future = pool.submit(_resolve_project, project_id)
+        provider = _get_bundle_provider(provider_name)
+        project_id, project_root = project_future.result()
+
+    # Local .env files are already cheap to read; only remote bundles
+    # are worth persisting between runs
+    cache_ttl = bundle_cache_ttl()
+    if cache_ttl and provider.name == "aws-secrets-manager":
+        provider = CachedBundleProvider(provider, cache_ttl)
 
-    provider = _get_bundle_provider(provider_name)
     bundle = provider.get_bundle(project_id)
 
     if not bundle.secrets:
         logger.info(f"No secrets found for project '{project_id}', "
                      "running command without injection")
 
-    # Build subprocess environment
-    env = os.environ.copy()
-    env.update(bundle.secrets)
-    if extra_env:
-        env.update(extra_env)
+    # Nested creds invocations in the child reuse this project while they
+    # stay inside its root; without a root, drop any identity this process
+    # inherited so the child cannot pick up a stale one
+    if project_root is not None:
+        identity = {PROJECT_ID_ENV: project_id, PROJECT_ROOT_ENV: str(project_root)}
+        env = {**os.environ, **bundle.secrets, **identity, **(extra_env or {})}
+    else:
+        env = {**os.environ, **bundle.secrets}
+        env.pop(PROJECT_ID_ENV, None)
+        env.pop(PROJECT_ROOT_ENV, None)
+        env.update(extra_env or {})
 
     # Log the action (never the values)
     log_action(
@@ -100,6 +144,18 @@ def run_with_secrets(
         f"{shlex.join(command)}"
     )
 
+    if exec_replace and os.name == "posix":
+        # exec skips atexit handlers, so write the audit entry and any
+        # buffered output now
+        flush_audit()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvpe(command[0], command, env)
+        except FileNotFoundError:
+            print(f"Error: command not found: {command[0]}", file=sys.stderr)
+            return 127
+
     try:
         result = subprocess.run(command, env=env)
         return result.returncode
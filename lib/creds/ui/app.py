@@ -13,8 +13,19 @@ Security:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import html
+import importlib.util
 import secrets
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
 
 from ..audit import log_action
 from ..base import BundleProvider, SecretBundle, SecretNotFoundError
@@ -44,11 +55,54 @@ def _import_deps():
         sys.exit(1)
 
 
+# Headers added to every response
+_SECURITY_HEADERS = {
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "style-src 'self' 'unsafe-inline'; "
+        "script-src 'self' 'unsafe-inline'; "
+        "form-action 'self'"
+    ),
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Cache-Control": "no-store",
+}
+
+
+# AWS providers and their availability probes, per (region, role ARN).
+# Probes are reused for a few minutes so a machine that gains
+# credentials while the UI runs is picked up without probing per request.
+_AWS_PROBE_TTL = 300.0
+_aws_probes: dict[tuple[str, str], tuple[float, Any, bool]] = {}
+
+
+def _aws_provider(region: str, role_arn: str = "") -> tuple[Any, bool]:
+    """Get a shared AWS provider and whether it is available."""
+    key = (region, role_arn)
+    cached = _aws_probes.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _AWS_PROBE_TTL:
+        return cached[1], cached[2]
+
+    from ..providers.aws import AWSSecretsProvider
+
+    aws = AWSSecretsProvider(region=region, role_arn=role_arn or None)
+    available = aws.is_available()
+    _aws_probes[key] = (time.monotonic(), aws, available)
+    return aws, available
+
+
+def _mask_value(value: str) -> str:
+    """Mask all but the first and last two characters of a value."""
+    if len(value) <= 4:
+        return "****"
+    return f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
+
+
 def _get_provider(
     config: SecretsConfig,
 ) -> BundleProvider:
     """Get the configured bundle provider."""
-    from ..providers.aws import AWSSecretsProvider
+    from ..providers.aws import AWSSecretsProvider, credentials_configured
     from ..providers.dotenv import DotEnvSecretsProvider
 
     if config.default_provider == "aws":
@@ -59,10 +113,11 @@ def _get_provider(
     elif config.default_provider == "dotenv":
         return DotEnvSecretsProvider()
     else:
-        # Auto-detect
-        aws = AWSSecretsProvider(region=config.aws_region)
-        if aws.is_available():
-            return aws
+        # Auto-detect; machines with no sign of AWS credentials skip the probe
+        if credentials_configured():
+            aws, available = _aws_provider(config.aws_region)
+            if available:
+                return aws
         return DotEnvSecretsProvider()
 
 
@@ -84,8 +139,9 @@ def create_app(
     _import_deps()
 
     from fastapi import Depends, FastAPI, HTTPException, Request
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
     from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+    from fastapi.staticfiles import StaticFiles
 
     if project_id is None:
         project_id = get_project_id()
@@ -94,31 +150,102 @@ def create_app(
     if auth_token is None:
         auth_token = secrets.token_urlsafe(32)
 
-    provider = _get_provider(config)
+    # Provider calls block on file or network I/O; run them on worker
+    # threads so one slow AWS call does not stall the event loop
+    io_pool = ThreadPoolExecutor(
+        max_workers=max(1, config.ui_io_workers), thread_name_prefix="creds-ui"
+    )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        # Let in-flight provider calls finish; drop any still queued
+        io_pool.shutdown(wait=True, cancel_futures=True)
 
     app = FastAPI(
         title="Claude Power Pack - Secrets",
         description="Local secrets management UI",
         docs_url=None,
         redoc_url=None,
+        lifespan=lifespan,
+        # orjson (in the ui extra) serializes API responses faster;
+        # fall back to the stdlib encoder when it is not installed
+        default_response_class=(
+            ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+        ),
     )
 
+    app.state.io_pool = io_pool
+
     security = HTTPBearer()
+    auth_token_bytes = auth_token.encode()
+
+    async def run_io(fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(io_pool, functools.partial(fn, *args, **kwargs))
+
+    # Provider selection may probe AWS; resolve it on first use so the
+    # server starts without waiting on the network
+    selected: list[BundleProvider] = []
+    provider_lock = asyncio.Lock()
+
+    async def get_provider() -> BundleProvider:
+        if not selected:
+            async with provider_lock:
+                if not selected:
+                    selected.append(await run_io(_get_provider, config))
+        return selected[0]
+
+    # --- Bundle cache ---
+
+    # Reads reuse a fetched bundle for config.ui_cache_ttl seconds so the
+    # UI does not hit the backend (an AWS call) on every request. The
+    # lock makes concurrent misses share one fetch and orders writes
+    # against reads, so a stale fetch cannot land after an invalidation.
+    bundle_cache: dict[str, tuple[float, SecretBundle]] = {}
+    bundle_lock = asyncio.Lock()
+
+    def fresh_bundle() -> SecretBundle | None:
+        cached = bundle_cache.get(project_id)
+        if cached is not None and time.monotonic() - cached[0] < config.ui_cache_ttl:
+            return cached[1]
+        return None
+
+    async def get_bundle() -> SecretBundle:
+        bundle = fresh_bundle()
+        if bundle is not None:
+            return bundle
+        async with bundle_lock:
+            bundle = fresh_bundle()
+            if bundle is None:
+                provider = await get_provider()
+                bundle = await run_io(provider.get_bundle, project_id)
+                bundle_cache[project_id] = (time.monotonic(), bundle)
+            return bundle
+
+    def patch_cached(key: str, value: str | None) -> None:
+        # Apply a completed write to the cached bundle (None deletes the
+        # key) so the next read need not refetch it; callers hold the lock
+        cached = bundle_cache.get(project_id)
+        if cached is None:
+            return
+        fetched_at, bundle = cached
+        updated = dict(bundle.secrets)
+        if value is None:
+            updated.pop(key, None)
+        else:
+            updated[key] = value
+        bundle_cache[project_id] = (fetched_at, replace(bundle, secrets=updated))
 
     # --- Middleware ---
 
     @app.middleware("http")
     async def security_headers(request: Request, call_next):
         response = await call_next(request)
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "form-action 'self'"
-        )
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Cache-Control"] = "no-store"
+        response.headers.update(_SECURITY_HEADERS)
+        if request.url.path.startswith("/static/"):
+            # Asset URLs carry a content hash, so they never go stale
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
         return response
 
     # --- Auth ---
@@ -126,7 +253,9 @@ def create_app(
     async def verify_token(
         credentials: HTTPAuthorizationCredentials = Depends(security),
     ):
-        if not secrets.compare_digest(credentials.credentials, auth_token):
+        # Compare bytes: compare_digest rejects non-ASCII str with TypeError,
+        # which would surface as a 500 instead of a 401
+        if not secrets.compare_digest(credentials.credentials.encode(), auth_token_bytes):
             raise HTTPException(status_code=401, detail="Invalid token")
 
     # --- API Routes ---
@@ -134,10 +263,10 @@ def create_app(
     @app.get("/api/secrets", dependencies=[Depends(verify_token)])
     async def list_secrets():
         """List all secret keys (values hidden)."""
-        bundle = provider.get_bundle(project_id)
+        bundle = await get_bundle()
         return {
             "project_id": project_id,
-            "provider": provider.name,
+            "provider": (await get_provider()).name,
             "count": len(bundle.secrets),
             "keys": [
                 {"key": k, "length": len(v)}
@@ -148,7 +277,7 @@ def create_app(
     @app.get("/api/secrets/{key}", dependencies=[Depends(verify_token)])
     async def get_secret(key: str, reveal: bool = False):
         """Get a single secret (masked unless reveal=true)."""
-        bundle = provider.get_bundle(project_id)
+        bundle = await get_bundle()
         value = bundle.get(key)
         if value is None:
             raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
@@ -158,8 +287,7 @@ def create_app(
         if reveal:
             return {"key": key, "value": value, "masked": False}
         else:
-            masked = value[:2] + "*" * max(0, len(value) - 4) + value[-2:] if len(value) > 4 else "****"
-            return {"key": key, "value": masked, "masked": True}
+            return {"key": key, "value": _mask_value(value), "masked": True}
 
     @app.put("/api/secrets/{key}", dependencies=[Depends(verify_token)])
     async def set_secret(key: str, request: Request):
@@ -173,7 +301,10 @@ def create_app(
             project_id=project_id,
             secrets={key: value},
         )
-        provider.put_bundle(bundle, mode="merge")
+        provider = await get_provider()
+        async with bundle_lock:
+            await run_io(provider.put_bundle, bundle, mode="merge")
+            patch_cached(key, value)
 
         log_action("ui_set", project_id, f"key={key}")
 
@@ -182,10 +313,15 @@ def create_app(
     @app.delete("/api/secrets/{key}", dependencies=[Depends(verify_token)])
     async def delete_secret(key: str):
         """Delete a secret key."""
-        try:
-            provider.delete_key(project_id, key)
-        except SecretNotFoundError:
-            raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
+        provider = await get_provider()
+        async with bundle_lock:
+            try:
+                await run_io(provider.delete_key, project_id, key)
+            except SecretNotFoundError:
+                # The cached bundle disagreed with the backend; drop it
+                bundle_cache.pop(project_id, None)
+                raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
+            patch_cached(key, None)
 
         log_action("ui_delete", project_id, f"key={key}")
 
@@ -194,11 +330,10 @@ def create_app(
     @app.post("/api/promote", dependencies=[Depends(verify_token)])
     async def promote_to_aws(request: Request):
         """Promote local secrets to AWS Secrets Manager."""
-        from ..providers.aws import AWSSecretsProvider
         from ..providers.dotenv import DotEnvSecretsProvider
 
         local = DotEnvSecretsProvider()
-        local_bundle = local.get_bundle(project_id)
+        local_bundle = await run_io(local.get_bundle, project_id)
 
         if not local_bundle.secrets:
             raise HTTPException(
@@ -206,14 +341,17 @@ def create_app(
                 detail="No local secrets to promote",
             )
 
-        aws = AWSSecretsProvider(region=config.aws_region)
-        if not aws.is_available():
+        aws, available = await run_io(_aws_provider, config.aws_region)
+        if not available:
             raise HTTPException(
                 status_code=503,
                 detail="AWS Secrets Manager not available",
             )
 
-        aws.put_bundle(local_bundle, mode="merge")
+        async with bundle_lock:
+            await run_io(aws.put_bundle, local_bundle, mode="merge")
+            # The UI may be serving the AWS bundle that was just written
+            bundle_cache.pop(project_id, None)
 
         log_action(
             "ui_promote",
@@ -230,6 +368,7 @@ def create_app(
     @app.get("/api/info", dependencies=[Depends(verify_token)])
     async def info():
         """Get provider and project info."""
+        provider = await get_provider()
         caps = provider.caps()
         return {
             "project_id": project_id,
@@ -244,57 +383,48 @@ def create_app(
             },
         }
 
+    @app.get("/api/bootstrap", dependencies=[Depends(verify_token)])
+    async def bootstrap():
+        """Get the key list and provider info in one round trip (page load)."""
+        return {**await info(), **await list_secrets()}
+
     # --- HTML UI ---
 
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
+    # The page depends only on the project and token, both fixed for the
+    # app's lifetime, so render and encode it once
+    home_page = _render_html(project_id, auth_token).encode("utf-8")
+
     @app.get("/", response_class=HTMLResponse)
     async def home():
         """Serve the main UI page."""
-        return _render_html(project_id, auth_token)
+        return HTMLResponse(content=home_page)
 
     return app, auth_token
 
 
-def _render_html(project_id: str, token: str) -> str:
-    """Render the single-page HTML UI."""
-    return f"""<!DOCTYPE html>
+_STATIC_DIR = Path(__file__).parent / "static"
+
+
+@functools.cache
+def _asset_version() -> str:
+    """Hash the static assets so their URLs change whenever they do."""
+    digest = hashlib.blake2b(digest_size=6)
+    for name in ("app.css", "app.js"):
+        digest.update((_STATIC_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="creds-token" content="{token}">
 <title>Secrets - {project_id}</title>
-<style>
-  * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-  body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-         background: #1a1a2e; color: #e0e0e0; padding: 2rem; max-width: 800px; margin: 0 auto; }}
-  h1 {{ color: #7c8cf8; margin-bottom: 0.5rem; }}
-  .subtitle {{ color: #888; margin-bottom: 2rem; }}
-  .card {{ background: #16213e; border-radius: 8px; padding: 1.5rem; margin-bottom: 1rem; }}
-  .key-row {{ display: flex; align-items: center; justify-content: space-between;
-              padding: 0.75rem 0; border-bottom: 1px solid #1a1a2e; }}
-  .key-row:last-child {{ border-bottom: none; }}
-  .key-name {{ font-family: monospace; font-size: 0.95rem; color: #7c8cf8; }}
-  .key-value {{ font-family: monospace; color: #888; }}
-  .actions {{ display: flex; gap: 0.5rem; }}
-  button {{ background: #7c8cf8; color: #fff; border: none; padding: 0.4rem 0.8rem;
-            border-radius: 4px; cursor: pointer; font-size: 0.85rem; }}
-  button:hover {{ background: #6b7de8; }}
-  button.danger {{ background: #e74c3c; }}
-  button.danger:hover {{ background: #c0392b; }}
-  button.secondary {{ background: #333; }}
-  button.secondary:hover {{ background: #444; }}
-  input {{ background: #0f3460; border: 1px solid #333; color: #e0e0e0; padding: 0.4rem 0.8rem;
-           border-radius: 4px; font-family: monospace; width: 100%; }}
-  input[type="password"] {{ letter-spacing: 0.2em; }}
-  .add-form {{ display: flex; gap: 0.5rem; margin-top: 1rem; }}
-  .add-form input {{ flex: 1; }}
-  .info {{ color: #888; font-size: 0.85rem; margin-top: 1rem; }}
-  .status {{ padding: 0.5rem 1rem; border-radius: 4px; margin-bottom: 1rem; }}
-  .status.ok {{ background: #1e4620; color: #4caf50; }}
-  .status.error {{ background: #4a1515; color: #e74c3c; }}
-  .hidden {{ display: none; }}
-  #promote-btn {{ margin-top: 1rem; }}
-  .autocomplete-off input {{ autocomplete: off; }}
-</style>
+<link rel="stylesheet" href="/static/app.css?v={version}">
+<script src="/static/app.js?v={version}" defer></script>
 </head>
 <body>
 <h1>Secrets Manager</h1>
@@ -316,109 +446,23 @@ def _render_html(project_id: str, token: str) -> str:
 </button>
 
 <p class="info" id="provider-info">Loading provider info...</p>
-
-<script>
-const TOKEN = "{token}";
-const H = {{"Authorization": "Bearer " + TOKEN, "Content-Type": "application/json"}};
-
-async function api(method, path, body) {{
-  const opts = {{method, headers: H}};
-  if (body) opts.body = JSON.stringify(body);
-  const res = await fetch("/api" + path, opts);
-  if (!res.ok) {{
-    const err = await res.json().catch(() => ({{detail: res.statusText}}));
-    throw new Error(err.detail || res.statusText);
-  }}
-  return res.json();
-}}
-
-function showStatus(msg, ok) {{
-  const el = document.getElementById("status");
-  el.textContent = msg;
-  el.className = "status " + (ok ? "ok" : "error");
-  el.classList.remove("hidden");
-  setTimeout(() => el.classList.add("hidden"), 3000);
-}}
-
-async function loadSecrets() {{
-  try {{
-    const data = await api("GET", "/secrets");
-    const list = document.getElementById("secrets-list");
-    if (data.keys.length === 0) {{
-      list.innerHTML = '<p style="color:#888">No secrets yet. Add one below.</p>';
-      return;
-    }}
-    list.innerHTML = data.keys.map(k => `
-      <div class="key-row" id="row-${{k.key}}">
-        <span class="key-name">${{k.key}}</span>
-        <span class="key-value" id="val-${{k.key}}">**** (${{k.length}} chars)</span>
-        <div class="actions">
-          <button class="secondary" onclick="reveal('${{k.key}}')">Reveal</button>
-          <button class="danger" onclick="del('${{k.key}}')">Delete</button>
-        </div>
-      </div>
-    `).join("");
-  }} catch (e) {{
-    showStatus("Error loading secrets: " + e.message, false);
-  }}
-}}
-
-async function reveal(key) {{
-  try {{
-    const data = await api("GET", "/secrets/" + key + "?reveal=true");
-    document.getElementById("val-" + key).textContent = data.value;
-    setTimeout(() => loadSecrets(), 5000);
-  }} catch (e) {{ showStatus(e.message, false); }}
-}}
-
-async function del(key) {{
-  if (!confirm("Delete " + key + "?")) return;
-  try {{
-    await api("DELETE", "/secrets/" + key);
-    showStatus("Deleted " + key, true);
-    loadSecrets();
-  }} catch (e) {{ showStatus(e.message, false); }}
-}}
-
-async function addSecret(e) {{
-  e.preventDefault();
-  const key = document.getElementById("new-key").value.trim();
-  const value = document.getElementById("new-value").value;
-  if (!key || !value) return;
-  try {{
-    await api("PUT", "/secrets/" + key, {{value}});
-    showStatus("Added " + key, true);
-    document.getElementById("new-key").value = "";
-    document.getElementById("new-value").value = "";
-    loadSecrets();
-  }} catch (e) {{ showStatus(e.message, false); }}
-}}
-
-async function promote() {{
-  if (!confirm("Promote all local secrets to AWS Secrets Manager?")) return;
-  try {{
-    const data = await api("POST", "/promote");
-    showStatus("Promoted " + data.promoted + " secrets to AWS", true);
-  }} catch (e) {{ showStatus(e.message, false); }}
-}}
-
-async function loadInfo() {{
-  try {{
-    const data = await api("GET", "/info");
-    document.getElementById("provider-info").textContent =
-      "Provider: " + data.provider + " | " +
-      "Capabilities: " + Object.entries(data.capabilities)
-        .filter(([k,v]) => v).map(([k]) => k).join(", ");
-  }} catch (e) {{}}
-}}
-
-loadSecrets();
-loadInfo();
-</script>
 </body>
 </html>"""
 
 
+def _render_html(project_id: str, token: str) -> str:
+    """Render the single-page HTML UI.
+
+    Styles and script live in static/ so browsers can cache them; the
+    page itself carries only the project and the token.
+    """
+    return _HTML_TEMPLATE.format_map({
+        "project_id": project_id,
+        "token": html.escape(token),
+        "version": _asset_version(),
+    })
+
+
 def run_server(
     project_id: str | None = None,
     config: SecretsConfig | None = None,
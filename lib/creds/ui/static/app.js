@@ -0,0 +1,106 @@
+const TOKEN = document.querySelector('meta[name="creds-token"]').content;
+const H = {"Authorization": "Bearer " + TOKEN, "Content-Type": "application/json"};
+
+async function api(method, path, body) {
+  const opts = {method, headers: H};
+  if (body) opts.body = JSON.stringify(body);
+  const res = await fetch("/api" + path, opts);
+  if (!res.ok) {
+    const err = await res.json().catch(() => ({detail: res.statusText}));
+    throw new Error(err.detail || res.statusText);
+  }
+  return res.json();
+}
+
+function showStatus(msg, ok) {
+  const el = document.getElementById("status");
+  el.textContent = msg;
+  el.className = "status " + (ok ? "ok" : "error");
+  el.classList.remove("hidden");
+  setTimeout(() => el.classList.add("hidden"), 3000);
+}
+
+function renderSecrets(data) {
+  const list = document.getElementById("secrets-list");
+  if (data.keys.length === 0) {
+    list.innerHTML = '<p style="color:#888">No secrets yet. Add one below.</p>';
+    return;
+  }
+  list.innerHTML = data.keys.map(k => `
+    <div class="key-row" id="row-${k.key}">
+      <span class="key-name">${k.key}</span>
+      <span class="key-value" id="val-${k.key}">**** (${k.length} chars)</span>
+      <div class="actions">
+        <button class="secondary" onclick="reveal('${k.key}')">Reveal</button>
+        <button class="danger" onclick="del('${k.key}')">Delete</button>
+      </div>
+    </div>
+  `).join("");
+}
+
+function renderInfo(data) {
+  document.getElementById("provider-info").textContent =
+    "Provider: " + data.provider + " | " +
+    "Capabilities: " + Object.entries(data.capabilities)
+      .filter(([k,v]) => v).map(([k]) => k).join(", ");
+}
+
+async function loadSecrets() {
+  try {
+    renderSecrets(await api("GET", "/secrets"));
+  } catch (e) {
+    showStatus("Error loading secrets: " + e.message, false);
+  }
+}
+
+// Initial load: keys and provider info in one request
+async function loadAll() {
+  try {
+    const data = await api("GET", "/bootstrap");
+    renderSecrets(data);
+    renderInfo(data);
+  } catch (e) {
+    showStatus("Error loading secrets: " + e.message, false);
+  }
+}
+
+async function reveal(key) {
+  try {
+    const data = await api("GET", "/secrets/" + key + "?reveal=true");
+    document.getElementById("val-" + key).textContent = data.value;
+    setTimeout(() => loadSecrets(), 5000);
+  } catch (e) { showStatus(e.message, false); }
+}
+
+async function del(key) {
+  if (!confirm("Delete " + key + "?")) return;
+  try {
+    await api("DELETE", "/secrets/" + key);
+    showStatus("Deleted " + key, true);
+    loadSecrets();
+  } catch (e) { showStatus(e.message, false); }
+}
+
+async function addSecret(e) {
+  e.preventDefault();
+  const key = document.getElementById("new-key").value.trim();
+  const value = document.getElementById("new-value").value;
+  if (!key || !value) return;
+  try {
+    await api("PUT", "/secrets/" + key, {value});
+    showStatus("Added " + key, true);
+    document.getElementById("new-key").value = "";
+    document.getElementById("new-value").value = "";
+    loadSecrets();
+  } catch (e) { showStatus(e.message, false); }
+}
+
+async function promote() {
+  if (!confirm("Promote all local secrets to AWS Secrets Manager?")) return;
+  try {
+    const data = await api("POST", "/promote");
+    showStatus("Promoted " + data.promoted + " secrets to AWS", true);
+  } catch (e) { showStatus(e.message, false); }
+}
+
+loadAll();
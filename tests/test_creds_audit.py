@@ -0,0 +1,76 @@
+"""Tests for lib/creds/audit.py."""
+
+from __future__ import annotations
+
+import stat
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from lib.creds import audit
+
+
+@pytest.fixture
+def audit_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    audit._get_audit_log_path.cache_clear()
+    yield tmp_path / "claude-power-pack" / "audit.log"
+    audit._get_audit_log_path.cache_clear()
+
+
+class TestLogAction:
+    """Test audit log writes."""
+
+    def test_entries_written_after_flush(self, audit_log: Path) -> None:
+        audit.log_action("set", "my-app", "key=API_KEY")
+        audit.log_action("delete", "my-app", "key=OLD_KEY")
+        audit.flush()
+
+        lines = audit_log.read_text().splitlines()
+        assert len(lines) == 2
+        assert " | set | my-app | " in lines[0]
+        assert lines[0].endswith(" | key=API_KEY")
+        assert " | delete | my-app | " in lines[1]
+
+    def test_log_created_owner_only(self, audit_log: Path) -> None:
+        audit.log_action("get", "my-app", "key=DB_PASSWORD")
+        audit.flush()
+
+        assert stat.S_IMODE(audit_log.stat().st_mode) == 0o600
+
+    def test_appends_to_existing_log(self, audit_log: Path) -> None:
+        audit_log.parent.mkdir(parents=True)
+        audit_log.write_text("earlier entry\n")
+
+        audit.log_action("rotate", "my-app", "key=DB_PASSWORD")
+        audit.flush()
+
+        lines = audit_log.read_text().splitlines()
+        assert lines[0] == "earlier entry"
+        assert " | rotate | my-app | " in lines[1]
+
+    def test_timestamp_is_utc_iso8601(self, audit_log: Path) -> None:
+        audit.log_action("get", "my-app")
+        audit.flush()
+
+        stamp = audit_log.read_text().split(" | ", 1)[0]
+        parsed = datetime.fromisoformat(stamp)
+        assert parsed.utcoffset() == timedelta(0)
+        assert abs(datetime.now(timezone.utc) - parsed) < timedelta(minutes=1)
+
+    def test_log_path_resolved_once(self, audit_log: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        assert audit._get_audit_log_path() == audit_log
+        monkeypatch.setenv("XDG_CONFIG_HOME", "/elsewhere")
+        assert audit._get_audit_log_path() == audit_log
+
+    def test_write_failure_does_not_raise(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(blocker))
+        audit._get_audit_log_path.cache_clear()
+
+        audit.log_action("get", "my-app")
+        audit.flush()
+        audit._get_audit_log_path.cache_clear()
@@ -55,6 +55,18 @@ class TestSecretValue:
         assert a == b
         assert a != c
 
+    def test_equality_none_and_non_ascii(self) -> None:
+        assert SecretValue(None) == SecretValue(None)
+        assert SecretValue(None) != SecretValue("")
+        assert SecretValue("pässwörd") == SecretValue("pässwörd")
+        assert SecretValue("pässwörd") != SecretValue("passwort")
+
+    def test_equality_surrogate_escaped(self) -> None:
+        # Undecodable bytes read with surrogateescape, as os.environ does
+        assert SecretValue("x\udcff") == SecretValue("x\udcff")
+        assert SecretValue("x\udcff") != SecretValue("x\udcfe")
+        assert SecretValue("x\udcff") != SecretValue("x")
+
     def test_equality_different_type(self) -> None:
         sv = SecretValue("secret")
         assert sv != "secret"
@@ -71,6 +83,20 @@ class TestSecretValue:
         assert len(SecretValue("hello")) == 5
         assert len(SecretValue(None)) == 0
 
+    def test_empty_values_are_shared(self) -> None:
+        assert SecretValue(None) is SecretValue(None)
+        assert SecretValue("") is SecretValue("")
+        assert SecretValue(None).get_secret_value() is None
+        assert SecretValue("").get_secret_value() == ""
+        assert SecretValue("a") is not SecretValue("a")
+
+    def test_pickle_roundtrip(self) -> None:
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(SecretValue("secret")))
+        assert restored.get_secret_value() == "secret"
+        assert pickle.loads(pickle.dumps(SecretValue(None))) is SecretValue(None)
+
 
 class TestSecretBundle:
     """Test SecretBundle dataclass."""
@@ -119,6 +145,33 @@ class TestSecretBundle:
         assert "secret123" not in s
         assert "KEY = ****" in s
 
+    def test_str_sorted_keys(self) -> None:
+        bundle = SecretBundle(project_id="app", secrets={"B": "2", "A": "1"})
+        assert str(bundle) == "Project: app (2 secrets)\n  A = ****\n  B = ****"
+
+    def test_str_tracks_key_changes(self) -> None:
+        bundle = SecretBundle(project_id="app", secrets={"A": "1"})
+        assert str(bundle) is str(bundle)
+        bundle.set("B", "2")
+        assert "B = ****" in str(bundle)
+        bundle.secrets["C"] = "3"  # direct dict edits are picked up too
+        del bundle.secrets["A"]
+        assert str(bundle) == "Project: app (2 secrets)\n  B = ****\n  C = ****"
+        bundle.project_id = "other"
+        assert str(bundle).startswith("Project: other ")
+
+    def test_str_cache_ignored_by_equality(self) -> None:
+        a = SecretBundle(project_id="app", secrets={"A": "1"})
+        b = SecretBundle(project_id="app", secrets={"A": "1"})
+        str(a)
+        assert a == b
+
+    def test_slotted(self) -> None:
+        bundle = SecretBundle(project_id="app")
+        assert not hasattr(bundle, "__dict__")
+        with pytest.raises(AttributeError):
+            bundle.extra = 1  # type: ignore[attr-defined]
+
 
 class TestProviderCaps:
     """Test ProviderCaps flags."""
@@ -19,6 +19,8 @@ class TestSecretsConfigDefaults:
         assert config.aws_role_arn == ""
         assert config.ui_host == "127.0.0.1"
         assert config.ui_port == 8090
+        assert config.ui_cache_ttl == 10.0
+        assert config.ui_io_workers == 4
         assert config.rotation_warn_days == 90
 
 
@@ -40,6 +42,7 @@ class TestSecretsConfigLoad:
             "  role_arn: arn:aws:iam::role/test\n"
             "ui:\n"
             "  port: 9090\n"
+            "  cache_ttl: 2.5\n"
             "rotation:\n"
             "  warn_days: 60\n"
         )
@@ -50,6 +53,7 @@ class TestSecretsConfigLoad:
             assert config.default_provider == "aws"
             assert config.aws_region == "ca-central-1"
             assert config.ui_port == 9090
+            assert config.ui_cache_ttl == 2.5
             assert config.rotation_warn_days == 60
         except ImportError:
             pytest.skip("PyYAML not installed")
@@ -67,3 +71,17 @@ class TestSecretsConfigLoad:
             assert config.default_provider == "auto"
         except ImportError:
             pytest.skip("PyYAML not installed")
+
+    def test_load_cached_until_file_changes(self, tmp_path: Path) -> None:
+        pytest.importorskip("yaml")
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        yaml_file = claude_dir / "secrets.yml"
+        yaml_file.write_text("default_provider: aws\n")
+
+        first = SecretsConfig.load(str(tmp_path))
+        first.default_provider = "mutated"
+        assert SecretsConfig.load(str(tmp_path)).default_provider == "aws"
+
+        yaml_file.write_text("default_provider: dotenv\n")
+        assert SecretsConfig.load(str(tmp_path)).default_provider == "dotenv"
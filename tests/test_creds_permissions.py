@@ -0,0 +1,62 @@
+"""Tests for lib/creds/permissions.py."""
+
+from __future__ import annotations
+
+import pytest
+
+from lib.creds.permissions import AccessLevel, OperationType, PermissionConfig
+
+
+class TestCanExecute:
+    """Test PermissionConfig.can_execute."""
+
+    def test_read_only_default(self) -> None:
+        config = PermissionConfig()
+        assert config.can_execute(OperationType.SELECT, "users") == (True, "Allowed")
+        allowed, reason = config.can_execute(OperationType.DELETE, "users")
+        assert not allowed
+        assert "admin" in reason
+
+    def test_table_lists_case_insensitive(self) -> None:
+        config = PermissionConfig.read_write(tables=["Users", "orders"], denied_tables=["Secrets"])
+        assert config.can_execute(OperationType.INSERT, "USERS")[0]
+        assert not config.can_execute(OperationType.SELECT, "secrets")[0]
+        assert not config.can_execute(OperationType.SELECT, "payments")[0]
+
+    def test_empty_allow_list_denies_all(self) -> None:
+        config = PermissionConfig(access_level=AccessLevel.READ_ONLY, allowed_tables=[])
+        assert not config.can_execute(OperationType.SELECT, "users")[0]
+
+    def test_reassigned_lists_take_effect(self) -> None:
+        config = PermissionConfig.read_only(tables=["users"])
+        config.allowed_tables = None
+        config.denied_tables = ["users"]
+        assert config.can_execute(OperationType.SELECT, "orders")[0]
+        assert not config.can_execute(OperationType.SELECT, "Users")[0]
+
+    def test_lists_are_frozen(self) -> None:
+        config = PermissionConfig(denied_tables=["secrets"])
+        assert config.denied_tables == ("secrets",)
+        with pytest.raises(AttributeError):
+            config.denied_tables.append("users")  # type: ignore[union-attr, attr-defined]
+        config.denied_tables = [*config.denied_tables, "Users"]
+        assert not config.can_execute(OperationType.SELECT, "users")[0]
+
+
+class TestConfirmation:
+    """Test confirmation requirements."""
+
+    def test_default_destructive_ops(self) -> None:
+        config = PermissionConfig()
+        assert config.needs_confirmation(OperationType.DROP)
+        assert not config.needs_confirmation(OperationType.SELECT)
+
+    def test_admin_without_confirmation(self) -> None:
+        config = PermissionConfig.admin(require_confirmation=False)
+        assert not config.needs_confirmation(OperationType.DROP)
+
+    def test_reassigned_confirmation_takes_effect(self) -> None:
+        config = PermissionConfig()
+        assert not config.needs_confirmation(OperationType.UPDATE)
+        config.require_confirmation = [*config.require_confirmation, OperationType.UPDATE]
+        assert config.needs_confirmation(OperationType.UPDATE)
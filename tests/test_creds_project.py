@@ -0,0 +1,135 @@
+"""Tests for lib/creds/project.py."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lib.creds import project
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _no_project_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(project.PROJECT_ID_ENV, raising=False)
+    monkeypatch.delenv(project.PROJECT_ROOT_ENV, raising=False)
+
+
+@pytest.fixture
+def git_calls(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    """Record git subprocesses spawned by lib.creds.project."""
+    calls: list[object] = []
+    real_run = subprocess.run
+
+    def counting_run(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args)
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(project.subprocess, "run", counting_run)
+    return calls
+
+
+class TestProjectRoot:
+    """Test git root detection and its per-directory cache."""
+
+    @requires_git
+    def test_root_and_id(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, git_calls: list[object]
+    ) -> None:
+        repo = _init_repo(tmp_path / "My-App")
+        (repo / "sub").mkdir()
+        monkeypatch.chdir(repo / "sub")
+        git_calls.clear()
+        assert project.get_project_root() == repo.resolve()
+        assert project.get_project_id() == "my-app"
+        assert git_calls == []
+
+    @requires_git
+    def test_worktree_resolves_main_repo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, git_calls: list[object]
+    ) -> None:
+        repo = _init_repo(tmp_path / "main")
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "init"], check=True)
+        subprocess.run([*git, "worktree", "add", "-q", str(tmp_path / "wt")], check=True)
+        monkeypatch.chdir(tmp_path / "wt")
+        git_calls.clear()
+        assert project.get_project_root() == repo.resolve()
+        assert git_calls == []
+
+    @requires_git
+    def test_cached_per_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        first = _init_repo(tmp_path / "first")
+        second = _init_repo(tmp_path / "second")
+        monkeypatch.chdir(first)
+        assert project.get_project_root() == first.resolve()
+        monkeypatch.chdir(second)
+        assert project.get_project_root() == second.resolve()
+
+    def test_outside_repo_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        with pytest.raises(RuntimeError):
+            project.get_project_root()
+
+
+class TestEnvironmentOverrides:
+    """Test project identity inherited through the environment."""
+
+    def test_project_id_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, git_calls: list[object]
+    ) -> None:
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        monkeypatch.setenv(project.PROJECT_ID_ENV, "inherited")
+        monkeypatch.setenv(project.PROJECT_ROOT_ENV, str(tmp_path))
+        assert project.get_project_id() == "inherited"
+        assert project.get_project_id(Path("/srv/Explicit")) == "explicit"
+        assert git_calls == []
+
+    @pytest.mark.parametrize("value", ["", "..", "a/b"])
+    def test_unsafe_project_id_ignored(
+        self, value: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root = tmp_path / "from-root"
+        root.mkdir()
+        monkeypatch.chdir(root)
+        monkeypatch.setenv(project.PROJECT_ID_ENV, value)
+        monkeypatch.setenv(project.PROJECT_ROOT_ENV, str(root))
+        assert project.get_project_id() == "from-root"
+
+    def test_project_root_from_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(project.PROJECT_ROOT_ENV, str(tmp_path))
+        assert project.get_project_root() == tmp_path
+
+    @requires_git
+    def test_inherited_identity_ignored_outside_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        inherited = tmp_path / "parent"
+        inherited.mkdir()
+        other = _init_repo(tmp_path / "Other")
+        monkeypatch.chdir(other)
+        monkeypatch.setenv(project.PROJECT_ID_ENV, "parent")
+        monkeypatch.setenv(project.PROJECT_ROOT_ENV, str(inherited))
+        assert project.get_project_root() == other.resolve()
+        assert project.get_project_id() == "other"
+
+    def test_project_id_without_root_ignored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        monkeypatch.setenv(project.PROJECT_ID_ENV, "inherited")
+        with pytest.raises(RuntimeError):
+            project.get_project_id()
@@ -0,0 +1,797 @@
+"""Tests for lib/creds provider selection and the bundle providers."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+import lib.creds as creds
+import lib.creds.providers as providers
+import lib.creds.providers.aws as aws
+import lib.creds.providers.aws_lite as aws_lite
+import lib.creds.providers.cached as cached
+import lib.creds.providers.dotenv as dotenv
+from lib.creds.providers import DotEnvSecretsProvider, EnvSecretsProvider
+
+
+@pytest.fixture
+def no_aws(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Select providers as if boto3 were not installed."""
+    monkeypatch.setattr(providers, "AWSSecretsProvider", None)
+    monkeypatch.delenv("CLAUDE_POWER_PACK_FORCE_PROVIDER_REINIT", raising=False)
+    creds.reset_provider_cache()
+    yield
+    creds.reset_provider_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_aws_caches() -> Iterator[None]:
+    """Keep the AWS provider's shared caches from leaking between tests."""
+    yield
+    aws._SECRET_CACHE.clear()
+    aws._BUNDLE_CACHE.clear()
+    aws._CLIENT_CACHE.clear()
+    aws._STS_CLIENTS.clear()
+
+
+def test_providers_resolve_lazily() -> None:
+    assert creds.DotEnvSecretsProvider is DotEnvSecretsProvider
+    assert creds.EnvSecretsProvider is EnvSecretsProvider
+    with pytest.raises(AttributeError):
+        getattr(creds, "NoSuchProvider")
+
+
+class TestProviderSelection:
+    """Test get_provider / get_bundle_provider selection and caching."""
+
+    def test_falls_back_without_aws(self, no_aws: None) -> None:
+        assert isinstance(creds.get_provider(), EnvSecretsProvider)
+        assert isinstance(creds.get_bundle_provider(), DotEnvSecretsProvider)
+
+    def test_selection_is_cached(self, no_aws: None) -> None:
+        assert creds.get_provider() is creds.get_provider()
+        assert creds.get_bundle_provider() is creds.get_bundle_provider()
+
+    def test_reset_reselects(self, no_aws: None) -> None:
+        first = creds.get_bundle_provider()
+        creds.reset_provider_cache()
+        assert creds.get_bundle_provider() is not first
+
+    def test_force_reinit_env_bypasses_cache(
+        self, no_aws: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("CLAUDE_POWER_PACK_FORCE_PROVIDER_REINIT", "1")
+        assert creds.get_bundle_provider() is not creds.get_bundle_provider()
+
+
+class TestAWSCredentialsHint:
+    """Test the cheap check that gates the AWS availability probe."""
+
+    @pytest.fixture
+    def bare_host(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        for name in (*aws._AWS_CREDENTIAL_ENV, "AWS_SHARED_CREDENTIALS_FILE", "AWS_CONFIG_FILE"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        marker = tmp_path / "sys_vendor"
+        monkeypatch.setattr(aws, "_EC2_MARKERS", ((str(marker), "Amazon EC2"),))
+        return tmp_path
+
+    def test_nothing_configured(self, bare_host: Path) -> None:
+        assert aws.credentials_configured() is False
+
+    def test_env_credentials(self, bare_host: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AWS_PROFILE", "dev")
+        assert aws.credentials_configured() is True
+
+    def test_shared_credentials_file(self, bare_host: Path) -> None:
+        (bare_host / ".aws").mkdir()
+        (bare_host / ".aws" / "config").write_text("[default]\n")
+        assert aws.credentials_configured() is True
+
+    def test_ec2_host(self, bare_host: Path) -> None:
+        (bare_host / "sys_vendor").write_text("Amazon EC2\n")
+        assert aws.credentials_configured() is True
+
+    def test_selection_skips_probe(self, bare_host: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_probe(self: aws.AWSSecretsProvider) -> bool:
+            raise AssertionError("AWS probe should be skipped")
+
+        monkeypatch.setattr(aws.AWSSecretsProvider, "is_available", fail_probe)
+        monkeypatch.delenv("CLAUDE_POWER_PACK_FORCE_PROVIDER_REINIT", raising=False)
+        creds.reset_provider_cache()
+        try:
+            assert isinstance(creds.get_bundle_provider(), DotEnvSecretsProvider)
+        finally:
+            creds.reset_provider_cache()
+
+
+class TestEnvSecretValue:
+    """Test EnvSecretsProvider.get_secret_value."""
+
+    def test_direct_lookup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("APP_HOST", "db.local")
+        provider = EnvSecretsProvider(auto_load=False)
+        assert provider.get_secret_value("app", "host") == "db.local"
+        assert provider.get_secret_value("app", "HOST") is None
+        assert provider.get_secret_value("app", "port") is None
+
+    def test_unknown_prefix_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("NOPE_HOST", raising=False)
+        provider = EnvSecretsProvider(auto_load=False)
+        with pytest.raises(creds.SecretNotFoundError):
+            provider.get_secret_value("nope", "host")
+
+    def test_invalid_secret_id(self) -> None:
+        with pytest.raises(ValueError):
+            EnvSecretsProvider(auto_load=False).get_secret_value("bad id", "host")
+
+
+class TestDotEnvParseCache:
+    """Test reuse of parsed .env files by the dotenv provider."""
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        parses: list[Path] = []
+        real_parse = dotenv._parse_env_file
+
+        def counting_parse(path: Path) -> dict[str, str]:
+            parses.append(path)
+            return real_parse(path)
+
+        monkeypatch.setattr(dotenv, "_parse_env_file", counting_parse)
+        provider.get_bundle("app").set("B", "2")
+        assert provider.get_bundle("app").secrets == {"A": "1"}
+        assert provider.list_keys("app") == ["A"]
+        assert len(parses) == 1
+
+    def test_replaced_file_with_same_stamp_is_reparsed(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        env_file = tmp_path / "app" / ".env"
+        assert provider.get_bundle("app").secrets == {"A": "1"}
+        # An atomic replace with the same size and mtime still changes the inode
+        before = env_file.stat()
+        replacement = tmp_path / "app" / ".env.new"
+        replacement.write_text(env_file.read_text().replace("A=1", "A=2"))
+        os.utime(replacement, ns=(before.st_atime_ns, before.st_mtime_ns))
+        os.replace(replacement, env_file)
+        assert provider.get_bundle("app").secrets == {"A": "2"}
+
+    def test_noop_merge_leaves_file(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1", "B": "2"}))
+        env_file = tmp_path / "app" / ".env"
+        before = env_file.read_text()
+        result = provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        assert result.secrets == {"A": "1", "B": "2"}
+        assert env_file.read_text() == before
+
+    def test_writes_are_seen(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        assert provider.list_keys("app") == ["A"]
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "2"}))
+        assert provider.get_bundle("app").secrets == {"A": "2"}
+        provider.delete_key("app", "A")
+        assert provider.list_keys("app") == []
+
+    def test_get_bundles(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        for i in range(5):
+            provider.put_bundle(creds.SecretBundle(project_id=f"p{i}", secrets={"N": str(i)}))
+        ids = [f"p{i}" for i in range(5)] + ["none", "p0"]
+        bundles = provider.get_bundles(ids)
+        assert list(bundles) == [f"p{i}" for i in range(5)] + ["none"]
+        assert [b.get("N") for b in bundles.values()] == ["0", "1", "2", "3", "4", None]
+
+
+class TestDotEnvWrite:
+    """Test quoting of values written to .env files."""
+
+    @pytest.mark.parametrize("value", ["", "two words", "trailing\t", "a#b", "$HOME", "plain"])
+    def test_values_round_trip(self, value: str, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"KEY": value}))
+        assert provider.get_bundle("app").secrets == {"KEY": value}
+
+    def test_plain_values_unquoted(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "plain", "B": "a b"}))
+        lines = (tmp_path / "app" / ".env").read_text().splitlines()
+        assert "A=plain" in lines
+        assert "B='a b'" in lines
+
+    def test_quoting_matches_shlex(self, tmp_path: Path) -> None:
+        import shlex
+
+        values = {"A": "", "B": "it's", "C": 'say "hi"', "D": "back\\slash"}
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets=values))
+        lines = (tmp_path / "app" / ".env").read_text().splitlines()
+        assert all(f"{key}={shlex.quote(value)}" in lines for key, value in values.items())
+
+    def test_atomic_write(self, tmp_path: Path) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        env_file = tmp_path / "app" / ".env"
+        assert env_file.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in env_file.parent.iterdir()] == [".env"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider = DotEnvSecretsProvider(config_dir=tmp_path)
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+
+        def fail_replace(src: str, dst: Path) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(dotenv.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "2"}))
+        monkeypatch.undo()
+        assert provider.get_bundle("app").secrets == {"A": "1"}
+        assert [p.name for p in (tmp_path / "app").iterdir()] == [".env"]
+
+
+class _FakeSecretsManager:
+    """Minimal stand-in for a boto3 secretsmanager client."""
+
+    def __init__(self, secrets: dict[str, str]) -> None:
+        self.secrets = secrets
+        self.reads = 0
+        self.writes = 0
+
+    def get_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        self.reads += 1
+        return {"SecretString": json.dumps(self.secrets), "VersionId": "v1"}
+
+    def put_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        self.writes += 1
+        self.secrets = json.loads(kwargs["SecretString"])
+        return {"VersionId": "v2"}
+
+
+class TestAWSBundleCache:
+    """Test the AWS provider's bundle read cache."""
+
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> _FakeSecretsManager:
+        monkeypatch.setattr(aws, "BOTO3_AVAILABLE", True)
+        return _FakeSecretsManager({"A": "1"})
+
+    def _provider(self, client: _FakeSecretsManager, **kwargs: Any) -> aws.AWSSecretsProvider:
+        provider = aws.AWSSecretsProvider(**kwargs)
+        provider._client = client
+        return provider
+
+    def test_repeat_reads_are_cached(self, client: _FakeSecretsManager) -> None:
+        provider = self._provider(client)
+        assert provider.get_bundle("app").secrets == {"A": "1"}
+        assert provider.list_keys("app") == ["A"]
+        assert client.reads == 1
+
+    def test_cached_bundle_is_a_copy(self, client: _FakeSecretsManager) -> None:
+        provider = self._provider(client)
+        provider.get_bundle("app").set("B", "2")
+        assert provider.get_bundle("app").secrets == {"A": "1"}
+
+    def test_write_invalidates(self, client: _FakeSecretsManager) -> None:
+        provider = self._provider(client)
+        provider.get_bundle("app")
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"B": "2"}))
+        assert provider.get_bundle("app").secrets == {"A": "1", "B": "2"}
+
+    def test_noop_merge_skips_write(self, client: _FakeSecretsManager) -> None:
+        provider = self._provider(client)
+        result = provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "1"}))
+        assert client.writes == 0
+        assert result.secrets == {"A": "1"}
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"A": "2"}))
+        assert client.writes == 1
+
+    def test_cache_shared_across_instances(self, client: _FakeSecretsManager) -> None:
+        self._provider(client, region="us-east-1").get_bundle("app")
+        self._provider(client, region="us-east-1").get_bundle("app")
+        assert client.reads == 1
+        self._provider(client, region="eu-west-1").get_bundle("app")
+        assert client.reads == 2
+
+    def test_cache_disabled(self, client: _FakeSecretsManager) -> None:
+        provider = self._provider(client, cache_enabled=False)
+        provider.get_bundle("app")
+        provider.get_bundle("app")
+        assert client.reads == 2
+
+
+class TestAWSJson:
+    """Test secret payload (de)serialization with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(aws, "orjson", None)
+        payload = {"KEY": "välue", "QUOTE": 'a"b'}
+        assert aws._json_loads(aws._json_dumps(payload)) == payload
+        with pytest.raises(json.JSONDecodeError):
+            aws._json_loads("not json")
+
+
+class TestTTLCache:
+    """Test the bounded TTL cache shared by AWS providers."""
+
+    def test_expired_entries_dropped(self) -> None:
+        cache = aws._TTLCache()
+        cache.set("a", 1, timestamp=0.0)
+        assert cache.get("a", ttl=60) is None
+        cache.set("a", 1)
+        assert cache.get("a", ttl=60) == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = aws._TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a", ttl=60)
+        cache.set("c", 3)
+        assert cache.get("b", ttl=60) is None
+        assert cache.get("a", ttl=60) == 1
+        assert cache.get("c", ttl=60) == 3
+
+    def test_concurrent_misses_load_once(self) -> None:
+        cache = aws._TTLCache()
+        release = threading.Event()
+        calls: list[int] = []
+
+        def loader() -> int:
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.load, "k", 60, loader) for _ in range(4)]
+            while not calls:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            assert [f.result() for f in futures] == [42] * 4
+        assert calls == [1]
+        assert cache.get("k", ttl=60) == 42
+
+    def test_invalidate_during_load_not_cached(self) -> None:
+        cache = aws._TTLCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def stale_loader() -> str:
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(cache.load, "k", 60, stale_loader)
+            assert started.wait(5)
+            # A write lands while the read is still in flight
+            cache.invalidate("k")
+            release.set()
+            assert future.result() == "stale"
+        assert cache.get("k", ttl=60) is None
+        assert cache.load("k", 60, lambda: "fresh") == "fresh"
+
+    def test_load_error_not_cached(self) -> None:
+        cache = aws._TTLCache()
+
+        def failing() -> int:
+            raise creds.SecretsError("boom")
+
+        with pytest.raises(creds.SecretsError):
+            cache.load("k", 60, failing)
+        assert cache.load("k", 60, lambda: 1) == 1
+
+
+class _FakeBoto3:
+    """Stand-in for the boto3 module that records client construction."""
+
+    def __init__(self, lifetime: timedelta) -> None:
+        self.lifetime = lifetime
+        self.clients: list[str] = []
+        self.assumed = 0
+
+    def client(self, service: str, **kwargs: Any) -> Any:
+        self.clients.append(service)
+        return self if service == "sts" else object()
+
+    def assume_role(self, **kwargs: Any) -> dict[str, Any]:
+        self.assumed += 1
+        return {
+            "Credentials": {
+                "AccessKeyId": "id",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + self.lifetime,
+            }
+        }
+
+
+class TestBoto3LazyImport:
+    """Test that boto3 is imported only when a client is needed."""
+
+    def test_load_binds_botocore_exceptions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake_boto3 = types.ModuleType("boto3")
+        fake_exceptions = types.ModuleType("botocore.exceptions")
+        fake_exceptions.ClientError = type("ClientError", (Exception,), {})
+        fake_exceptions.NoCredentialsError = type("NoCredentialsError", (Exception,), {})
+        monkeypatch.setitem(sys.modules, "boto3", fake_boto3)
+        monkeypatch.setitem(sys.modules, "botocore", types.ModuleType("botocore"))
+        monkeypatch.setitem(sys.modules, "botocore.exceptions", fake_exceptions)
+        for name in ("boto3", "ClientError", "NoCredentialsError"):
+            monkeypatch.setattr(aws, name, getattr(aws, name))
+        monkeypatch.setattr(aws, "boto3", None)
+
+        assert aws._load_boto3() is fake_boto3
+        assert aws.ClientError is fake_exceptions.ClientError
+        assert aws.NoCredentialsError is fake_exceptions.NoCredentialsError
+
+
+class TestAWSAvailability:
+    """Test that availability is decided without an API call."""
+
+    @pytest.mark.parametrize("credentials", [object(), None])
+    def test_resolves_credentials_locally(self, credentials: object, monkeypatch: pytest.MonkeyPatch) -> None:
+        class FakeSession:
+            def __init__(self, region_name: str | None = None) -> None:
+                pass
+
+            def get_credentials(self) -> object:
+                return credentials
+
+        fake = types.SimpleNamespace(
+            session=types.SimpleNamespace(Session=FakeSession),
+            client=lambda *args, **kwargs: pytest.fail("no client should be built"),
+        )
+        monkeypatch.setattr(aws, "BOTO3_AVAILABLE", True)
+        monkeypatch.setattr(aws, "boto3", fake)
+        assert aws.AWSSecretsProvider().is_available() is (credentials is not None)
+
+
+class TestAWSClientCache:
+    """Test boto3 client reuse across provider instances."""
+
+    def _install(self, monkeypatch: pytest.MonkeyPatch, lifetime: timedelta = timedelta(hours=1)) -> _FakeBoto3:
+        fake = _FakeBoto3(lifetime)
+        monkeypatch.setattr(aws, "BOTO3_AVAILABLE", True)
+        monkeypatch.setattr(aws, "boto3", fake)
+        return fake
+
+    def test_client_shared_per_region(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake = self._install(monkeypatch)
+        first = aws.AWSSecretsProvider(region="us-east-1")._get_client()
+        assert aws.AWSSecretsProvider(region="us-east-1")._get_client() is first
+        assert aws.AWSSecretsProvider(region="eu-west-1")._get_client() is not first
+        assert fake.clients == ["secretsmanager", "secretsmanager"]
+
+    def test_assumed_role_reused_until_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake = self._install(monkeypatch)
+        role = "arn:aws:iam::123456789012:role/cpp-app-dev"
+        aws.AWSSecretsProvider(region="us-east-1", role_arn=role)._get_client()
+        aws.AWSSecretsProvider(region="us-east-1", role_arn=role)._get_client()
+        assert fake.assumed == 1
+        assert fake.clients.count("sts") == 1
+
+    def test_expiring_role_is_reassumed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake = self._install(monkeypatch, lifetime=timedelta(minutes=1))
+        provider = aws.AWSSecretsProvider(region="us-east-1", role_arn="arn:aws:iam::123456789012:role/r")
+        provider._get_client()
+        provider._get_client()
+        assert fake.assumed == 2
+        assert fake.clients.count("sts") == 1
+
+
+class _FakeBatchClient:
+    """Stand-in client serving named secrets through BatchGetSecretValue."""
+
+    def __init__(self, secrets: dict[str, dict[str, str] | str]) -> None:
+        self.secrets = secrets
+        self.batches: list[list[str]] = []
+
+    def _secret_string(self, name: str) -> str:
+        value = self.secrets[name]
+        return value if isinstance(value, str) else json.dumps(value)
+
+    def batch_get_secret_value(self, SecretIdList: list[str]) -> dict[str, Any]:
+        self.batches.append(SecretIdList)
+        return {
+            "SecretValues": [
+                {"Name": name, "ARN": f"arn:aws:secretsmanager:::secret:{name}",
+                 "SecretString": self._secret_string(name)}
+                for name in SecretIdList if name in self.secrets
+            ],
+            "Errors": [
+                {"SecretId": name, "ErrorCode": "ResourceNotFoundException", "Message": "missing"}
+                for name in SecretIdList if name not in self.secrets
+            ],
+        }
+
+
+class TestAWSBatchGet:
+    """Test fetching several AWS secrets in batches."""
+
+    def _provider(self, monkeypatch: pytest.MonkeyPatch, client: _FakeBatchClient) -> aws.AWSSecretsProvider:
+        monkeypatch.setattr(aws, "BOTO3_AVAILABLE", True)
+        provider = aws.AWSSecretsProvider()
+        provider._client = client
+        provider._available = True
+        return provider
+
+    def test_batches_and_dedupes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        names = [f"app/s{i}" for i in range(25)]
+        client = _FakeBatchClient({name: {"v": name} for name in names})
+        provider = self._provider(monkeypatch, client)
+        result = provider.get_secrets(names + names[:3])
+        assert result == {name: {"v": name} for name in names}
+        assert [len(batch) for batch in client.batches] == [20, 5]
+
+    def test_served_from_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = _FakeBatchClient({"app/a": {"v": "1"}, "app/b": {"v": "2"}})
+        provider = self._provider(monkeypatch, client)
+        provider.get_secrets(["app/a"])
+        assert provider.get_secret("app/a") == {"v": "1"}
+        provider.get_secrets(["app/a", "app/b"])
+        assert client.batches == [["app/a"], ["app/b"]]
+
+    def test_missing_secret_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider = self._provider(monkeypatch, _FakeBatchClient({"app/a": {"v": "1"}}))
+        with pytest.raises(creds.SecretNotFoundError, match="app/missing"):
+            provider.get_secrets(["app/a", "app/missing"])
+
+    def test_invalid_id_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider = self._provider(monkeypatch, _FakeBatchClient({}))
+        with pytest.raises(ValueError):
+            provider.get_secrets(["bad id"])
+
+    def test_iam_policy_allows_batch_get(self) -> None:
+        iam = aws.AWSSecretsProvider(region="us-east-1").bootstrap_iam("app", "123456789012")
+        statements = json.loads(iam["policy_document"])["Statement"]
+        assert {"Effect": "Allow", "Action": "secretsmanager:BatchGetSecretValue", "Resource": "*"} in statements
+        assert "secretsmanager:GetSecretValue" in statements[0]["Action"]
+
+    def test_cli_get_fetches_in_one_batch(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        from lib.creds import cli
+
+        client = _FakeBatchClient({
+            name: {"host": "db", "username": "u", "password": "p", "database": name}
+            for name in ("app/a", "app/b")
+        })
+        monkeypatch.setattr(aws.AWSSecretsProvider, "_get_client", lambda self: client)
+        monkeypatch.setattr(aws.AWSSecretsProvider, "is_available", lambda self: True)
+        parser = cli.create_parser("get")
+        args = parser.parse_args(["get", "app/a", "app/b", "--provider", "aws", "--json"])
+        assert cli.cmd_get(args) == 0
+        assert client.batches == [["app/a", "app/b"]]
+        assert set(json.loads(capsys.readouterr().out)) == {"app/a", "app/b"}
+
+    def test_get_bundles_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = _FakeBatchClient({"claude-power-pack/a": {"K": "1"}, "claude-power-pack/b": {"K": "2"}})
+        provider = self._provider(monkeypatch, client)
+        provider.get_bundles(["a"])  # served from the bundle cache below
+        client.batches.clear()
+        bundles = provider.get_bundles(["a", "b", "missing", "b"])
+        assert {pid: b.secrets for pid, b in bundles.items()} == {"a": {"K": "1"}, "b": {"K": "2"}, "missing": {}}
+        assert client.batches == [["claude-power-pack/b", "claude-power-pack/missing"]]
+        assert provider.get_bundle("b").secrets == {"K": "2"}
+        assert len(client.batches) == 1
+
+    def test_get_bundles_requires_aws(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        provider = self._provider(monkeypatch, _FakeBatchClient({}))
+        provider._available = False
+        with pytest.raises(creds.ProviderNotAvailableError):
+            provider.get_bundles(["a"])
+
+    def test_get_bundles_malformed_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = _FakeBatchClient({"claude-power-pack/a": "{not json"})
+        provider = self._provider(monkeypatch, client)
+        with pytest.raises(creds.SecretsError, match="'a'"):
+            provider.get_bundles(["a"])
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def read(self) -> bytes:
+        return json.dumps(self.payload).encode()
+
+
+class TestAWSLite:
+    """Test the boto3-free read-only AWS provider."""
+
+    CREDS = aws_lite.Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY")
+
+    @pytest.mark.parametrize(
+        ("method", "signature"),
+        [
+            ("GET", "5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31"),
+            ("POST", "5da7c1a2acd57cee7505fc6676e4e544621c30862966e37dddb68e92efbe5d6b"),
+        ],
+    )
+    def test_sign_v4_reference_vectors(self, method: str, signature: str) -> None:
+        # get-vanilla / post-vanilla from the AWS SigV4 test suite
+        headers = aws_lite.sign_v4(
+            method, "example.amazonaws.com", "us-east-1", "service", {}, b"", self.CREDS, "20150830T123600Z"
+        )
+        assert headers["authorization"] == (
+            "AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20150830/us-east-1/service/aws4_request, "
+            f"SignedHeaders=host;x-amz-date, Signature={signature}"
+        )
+
+    def test_session_token_is_signed(self) -> None:
+        creds = self.CREDS._replace(token="tok")
+        headers = aws_lite.sign_v4("POST", "h", "us-east-1", "s", {}, b"", creds, "20150830T123600Z")
+        assert headers["x-amz-security-token"] == "tok"
+        assert "x-amz-security-token" in headers["authorization"]
+
+    def test_get_bundle(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "id")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+        requests: list[Any] = []
+
+        def fake_urlopen(request: Any, timeout: float) -> _FakeResponse:
+            requests.append(request)
+            return _FakeResponse({"SecretString": json.dumps({"A": "1"}), "VersionId": "v1"})
+
+        monkeypatch.setattr(aws_lite.urllib.request, "urlopen", fake_urlopen)
+        provider = aws_lite.AWSLiteSecretsProvider(region="us-east-1")
+        bundle = provider.get_bundle("app")
+        assert bundle.secrets == {"A": "1"}
+        assert bundle.version == "v1"
+        assert json.loads(requests[0].data) == {"SecretId": "claude-power-pack/app"}
+        assert requests[0].get_header("X-amz-target") == "secretsmanager.GetSecretValue"
+
+    def test_unavailable_without_env_credentials(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+        provider = aws_lite.AWSLiteSecretsProvider()
+        assert provider.is_available() is False
+        with pytest.raises(creds.ProviderNotAvailableError):
+            provider.get_bundle("app")
+
+    def test_read_only(self) -> None:
+        with pytest.raises(creds.SecretsError):
+            aws_lite.AWSLiteSecretsProvider().put_bundle(creds.SecretBundle(project_id="app"))
+
+    @pytest.mark.parametrize(
+        "secret_id",
+        ["prod/db", "app_key+v2=x.y@z", "arn:aws:secretsmanager:us-east-1:123456789012:secret:prod/db-AbCdEf",
+         "arn:aws-us-gov:secretsmanager:us-gov-west-1:1:secret:x"],
+    )
+    def test_valid_secret_ids(self, secret_id: str) -> None:
+        aws_lite.validate_secret_id(secret_id)
+
+    @pytest.mark.parametrize("secret_id", ["", "bad id", "pässwort", "arn:aws:s3:::bucket", "x" * 513])
+    def test_invalid_secret_ids(self, secret_id: str) -> None:
+        with pytest.raises(ValueError):
+            aws_lite.validate_secret_id(secret_id)
+
+    def test_bundle_prefix_matches_boto3_provider(self) -> None:
+        assert aws_lite.AWSLiteSecretsProvider.BUNDLE_PREFIX == aws.AWSSecretsProvider.BUNDLE_PREFIX
+
+    def test_run_prefers_lite_with_env_credentials(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from lib.creds.run import _get_bundle_provider
+
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "id")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+        assert isinstance(_get_bundle_provider("aws"), aws_lite.AWSLiteSecretsProvider)
+        monkeypatch.delenv("AWS_ACCESS_KEY_ID")
+        assert isinstance(_get_bundle_provider("aws"), aws.AWSSecretsProvider)
+
+
+class _CountingProvider(DotEnvSecretsProvider):
+    """Dotenv provider that counts bundle reads."""
+
+    reads = 0
+    scope: tuple[str, ...] = ()
+
+    def cache_scope(self) -> tuple[str, ...]:
+        return self.scope
+
+    def get_bundle(self, project_id: str, version: str | None = None) -> creds.SecretBundle:
+        self.reads += 1
+        return super().get_bundle(project_id, version)
+
+
+class TestCachedBundleProvider:
+    """Test the persistent bundle cache wrapper."""
+
+    @pytest.fixture
+    def inner(self, tmp_path: Path) -> _CountingProvider:
+        provider = _CountingProvider(config_dir=tmp_path / "config")
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"KEY": "v1"}))
+        return provider
+
+    def test_hit_across_instances(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        first = cached.CachedBundleProvider(inner, ttl=60, cache_dir=cache_dir)
+        assert first.get_bundle("app").secrets == {"KEY": "v1"}
+        # A new wrapper stands in for the next process
+        second = cached.CachedBundleProvider(inner, ttl=60, cache_dir=cache_dir)
+        assert second.get_bundle("app").secrets == {"KEY": "v1"}
+        assert inner.reads == 1
+
+    def test_files_are_private(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        cached.CachedBundleProvider(inner, ttl=60, cache_dir=cache_dir).get_bundle("app")
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        (path,) = cache_dir.iterdir()
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_expires_after_ttl(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        provider = cached.CachedBundleProvider(inner, ttl=60, cache_dir=tmp_path / "cache")
+        provider.get_bundle("app")
+        (path,) = (tmp_path / "cache").iterdir()
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        provider.get_bundle("app")
+        assert inner.reads == 2
+
+    def test_writes_invalidate(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        provider = cached.CachedBundleProvider(inner, ttl=60, cache_dir=tmp_path / "cache")
+        provider.get_bundle("app")
+        provider.put_bundle(creds.SecretBundle(project_id="app", secrets={"KEY": "v2"}))
+        assert provider.get_bundle("app").secrets == {"KEY": "v2"}
+        provider.delete_key("app", "KEY")
+        assert provider.get_bundle("app").secrets == {}
+
+    def test_corrupt_file_is_a_miss(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        provider = cached.CachedBundleProvider(inner, ttl=60, cache_dir=tmp_path / "cache")
+        provider.get_bundle("app")
+        (path,) = (tmp_path / "cache").iterdir()
+        path.write_text("{not json")
+        assert provider.get_bundle("app").secrets == {"KEY": "v1"}
+        assert inner.reads == 2
+
+    def test_scope_change_is_a_miss(self, inner: _CountingProvider, tmp_path: Path) -> None:
+        provider = cached.CachedBundleProvider(inner, ttl=60, cache_dir=tmp_path / "cache")
+        inner.scope = ("us-east-1", "", "dev", "")
+        provider.get_bundle("app")
+        # Switching AWS_PROFILE (or region, role, keys) must refetch
+        inner.scope = ("us-east-1", "", "prod", "")
+        provider.get_bundle("app")
+        assert inner.reads == 2
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_aws_scope_tracks_credentials(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+        monkeypatch.setenv("AWS_PROFILE", "dev")
+        provider = aws.AWSSecretsProvider(region="eu-west-1", role_arn="arn:aws:iam::1:role/r")
+        dev = provider.cache_scope()
+        monkeypatch.setenv("AWS_PROFILE", "prod")
+        assert provider.cache_scope() != dev
+        assert dev == ("eu-west-1", "arn:aws:iam::1:role/r", "dev", "")
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(None, 0.0), ("0", 0.0), ("-5", 0.0), ("abc", 0.0), ("30", 30.0), ("86400", cached.MAX_BUNDLE_CACHE_TTL)],
+    )
+    def test_ttl_from_env(self, monkeypatch: pytest.MonkeyPatch, value: str | None, expected: float) -> None:
+        if value is None:
+            monkeypatch.delenv(cached.BUNDLE_CACHE_TTL_ENV, raising=False)
+        else:
+            monkeypatch.setenv(cached.BUNDLE_CACHE_TTL_ENV, value)
+        assert cached.bundle_cache_ttl() == expected
@@ -0,0 +1,102 @@
+"""Tests for lib/creds/run.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lib.creds import SecretBundle, run
+from lib.creds.providers import DotEnvSecretsProvider
+
+
+@pytest.fixture
+def provider(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DotEnvSecretsProvider:
+    """A dotenv provider holding one secret, used for every run."""
+    dotenv = DotEnvSecretsProvider(config_dir=tmp_path)
+    dotenv.put_bundle(SecretBundle(project_id="app", secrets={"API_KEY": "s3cret"}))
+    monkeypatch.setattr(run, "_get_bundle_provider", lambda name=None: dotenv)
+    monkeypatch.setattr(run, "log_action", lambda **kwargs: None)
+    return dotenv
+
+
+class TestExecReplace:
+    """Test replacing the process with the command instead of forking."""
+
+    def test_execs_with_secrets(self, provider: DotEnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[tuple[str, list[str], dict[str, str]]] = []
+        flushed: list[bool] = []
+
+        def fake_exec(file: str, args: list[str], env: dict[str, str]) -> Any:
+            calls.append((file, args, env))
+            raise SystemExit(0)  # execvpe never returns
+
+        monkeypatch.setattr(run.os, "execvpe", fake_exec)
+        monkeypatch.setattr(run, "flush_audit", lambda: flushed.append(True))
+        with pytest.raises(SystemExit):
+            run.run_with_secrets(["deploy", "--now"], project_id="app", exec_replace=True)
+
+        file, args, env = calls[0]
+        assert (file, args) == ("deploy", ["deploy", "--now"])
+        assert env["API_KEY"] == "s3cret"
+        assert flushed == [True]
+
+    def test_missing_command_returns_127(
+        self, provider: DotEnvSecretsProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_exec(file: str, args: list[str], env: dict[str, str]) -> Any:
+            raise FileNotFoundError(file)
+
+        monkeypatch.setattr(run.os, "execvpe", fake_exec)
+        assert run.run_with_secrets(["no-such-cmd"], project_id="app", exec_replace=True) == 127
+
+    def test_default_runs_child(self, provider: DotEnvSecretsProvider, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_exec(*args: Any) -> Any:
+            raise AssertionError("execvpe should not be used")
+
+        class Completed:
+            returncode = 3
+
+        monkeypatch.setattr(run.os, "execvpe", fail_exec)
+        monkeypatch.setattr(run.subprocess, "run", lambda command, env: Completed())
+        assert run.run_with_secrets(["deploy"], project_id="app") == 3
+
+
+class TestChildIdentity:
+    """Test the project identity exported to the child."""
+
+    def _child_env(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+        envs: list[dict[str, str]] = []
+
+        class Completed:
+            returncode = 0
+
+        def fake_run(command: list[str], env: dict[str, str]) -> Completed:
+            envs.append(env)
+            return Completed()
+
+        monkeypatch.setattr(run.subprocess, "run", fake_run)
+        run.run_with_secrets(["deploy"], project_id="app")
+        return envs[0]
+
+    def test_exports_id_and_root(
+        self, provider: DotEnvSecretsProvider, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(run, "get_project_root", lambda: tmp_path)
+        env = self._child_env(monkeypatch)
+        assert env[run.PROJECT_ID_ENV] == "app"
+        assert env[run.PROJECT_ROOT_ENV] == str(tmp_path)
+
+    def test_drops_inherited_identity_without_root(
+        self, provider: DotEnvSecretsProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_repo() -> Path:
+            raise RuntimeError("Not in a git repository")
+
+        monkeypatch.setattr(run, "get_project_root", no_repo)
+        monkeypatch.setenv(run.PROJECT_ID_ENV, "stale")
+        monkeypatch.setenv(run.PROJECT_ROOT_ENV, "/srv/stale")
+        env = self._child_env(monkeypatch)
+        assert run.PROJECT_ID_ENV not in env
+        assert run.PROJECT_ROOT_ENV not in env